@@ -4,10 +4,15 @@ A Python implementation of D* Lite algorithm for multi-robot path planning
 with collision detection on a 2D grid.
 """
 
+import logging
+
 from .core.world import GridWorld, CellType
 from .core.path_planners.dstar_lite_planner import DStarLitePlanner
 from .core.coordinator import MultiAgentCoordinator
 
+# Library modules log through logging; applications configure handlers
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 __version__ = "1.0.0"
 __author__ = "Your Name"
 __all__ = [
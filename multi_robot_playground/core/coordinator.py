@@ -1,19 +1,39 @@
-from typing import Dict, List, Tuple, Set, Optional
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, FrozenSet, Iterable, KeysView, List, Tuple, Set, Optional
 from .path_planners import get_planner_class, DEFAULT_PLANNER, get_planner_names
 
+logger = logging.getLogger(__name__)
+
 class MultiAgentCoordinator:
     """
     Coordinates multiple D* Lite planners for multi-agent navigation.
     Detects collisions but does not resolve them - just reports them.
     """
 
-    def __init__(self, world):
+    # Fixed attribute set: no per-instance __dict__, slot-indexed access
+    __slots__ = (
+        "world", "planners", "paths", "current_positions", "goals",
+        "robot_algorithms", "collision_blocked_robots", "collision_details",
+        "stuck_robots", "goal_blocked_robots", "_goal_counts",
+        "parallel_planning", "_known_obstacles", "_obstacles",
+    )
+
+    def __init__(self, world, parallel_planning: bool = False):
         self.world = world
+        # Replan robots in a thread pool (each planner only touches its own
+        # state). Off by default: pure-Python planners hold the GIL
+        self.parallel_planning = parallel_planning
         self.planners = {}  # robot_id -> PathPlanner instance
         self.paths = {}  # robot_id -> current planned path
         self.current_positions = {}  # robot_id -> current position
         self.goals = {}  # robot_id -> goal position
+        self._goal_counts = {}  # goal position -> number of robots with that goal
         self.robot_algorithms = {}  # robot_id -> algorithm name
+        # Obstacle sets each planner has been told about, so direct world
+        # edits can be forwarded as changed cells (see _unseen_changes)
+        self._known_obstacles = {}  # robot_id -> frozenset of obstacle cells
+        self._obstacles = frozenset()  # last world obstacle snapshot
 
         # Collision blocking state management
         self.collision_blocked_robots = {}  # robot_id -> block reason
@@ -31,18 +51,18 @@ class MultiAgentCoordinator:
         """
         # Check if we've reached the maximum number of robots
         if len(self.planners) >= 10:
-            print(f"Cannot add {robot_id}: Maximum of 10 robots reached")
+            logger.warning(f"Cannot add {robot_id}: Maximum of 10 robots reached")
             return False
 
         # Check if start position has an obstacle
         if not self.world.is_free(start[0], start[1]):
-            print(f"Cannot add {robot_id}: Position {start} has an obstacle")
+            logger.warning(f"Cannot add {robot_id}: Position {start} has an obstacle")
             return False
 
         # Check if start position is already occupied by another robot
         for existing_robot_id, pos in self.current_positions.items():
             if pos == start:
-                print(f"Cannot add {robot_id}: Position {start} is occupied by {existing_robot_id}")
+                logger.warning(f"Cannot add {robot_id}: Position {start} is occupied by {existing_robot_id}")
                 return False
 
         # Create planner for this robot using default algorithm
@@ -53,8 +73,10 @@ class MultiAgentCoordinator:
         # Store robot information
         self.planners[robot_id] = planner
         self.robot_algorithms[robot_id] = DEFAULT_PLANNER
+        self._known_obstacles[robot_id] = self._snapshot_obstacles()
         self.current_positions[robot_id] = start
         self.goals[robot_id] = goal
+        self._track_goal(goal, 1)
         self.world.robot_positions[robot_id] = start
 
         # Compute initial path
@@ -63,10 +85,19 @@ class MultiAgentCoordinator:
             self.paths[robot_id] = planner.get_path()
         else:
             self.paths[robot_id] = []
-            print(f"Warning: No initial path found for robot {robot_id} - Reason: {reason}")
+            logger.warning(f"No initial path found for robot {robot_id} - Reason: {reason}")
 
         return True
 
+    def add_robots(self, specs: List[Tuple[str, Tuple[int, int], Tuple[int, int]]]) -> List[str]:
+        """
+        Add several robots from (robot_id, start, goal) specs, in order.
+        Each spec follows the same rules as add_robot; rejected specs are skipped.
+        Returns the IDs of the robots that were added.
+        """
+        return [robot_id for robot_id, start, goal in specs
+                if self.add_robot(robot_id, start, goal)]
+
     def detect_collision_at_next_step(self, exclude_paused: bool = False) -> Optional[Tuple[str, str, str]]:
         """
         Check if robots will collide in the next step.
@@ -110,115 +141,114 @@ class MultiAgentCoordinator:
                 next_positions[robot_id] = self.current_positions[robot_id]
 
         # Pass 1: Detect path-to-path collisions
-        for i in range(len(robot_ids)):
-            for j in range(i + 1, len(robot_ids)):
-                robot1, robot2 = robot_ids[i], robot_ids[j]
-
-                pos1 = next_positions[robot1]
-                pos2 = next_positions[robot2]
-                curr_pos1 = self.current_positions[robot1]
-                curr_pos2 = self.current_positions[robot2]
-
-                # Same cell collision - both trying to enter same cell
-                if pos1 == pos2:
-                    colliding_robots[robot1] = "same_cell_collision"
-                    colliding_robots[robot2] = "same_cell_collision"
-                    collision_details.append({
-                        "type": "same_cell",
-                        "robots": [robot1, robot2],
-                        "position": pos1
-                    })
-                    continue
-
-                # Swap collision - exchanging positions
-                if pos1 == curr_pos2 and pos2 == curr_pos1:
-                    colliding_robots[robot1] = "swap_collision"
-                    colliding_robots[robot2] = "swap_collision"
-                    collision_details.append({
-                        "type": "swap",
-                        "robots": [robot1, robot2],
-                        "positions": [curr_pos1, curr_pos2]
-                    })
-                    continue
-
-                # Shear collision - perpendicular crossing
-                # Check if robot1 is entering robot2's current position
-                if pos1 == curr_pos2 and pos2 != curr_pos2:
-                    # Calculate movement directions
-                    dx1 = pos1[0] - curr_pos1[0]
-                    dy1 = pos1[1] - curr_pos1[1]
-                    dx2 = pos2[0] - curr_pos2[0]
-                    dy2 = pos2[1] - curr_pos2[1]
+        current_positions = self.current_positions
+        for i, j in self._candidate_pairs(robot_ids, next_positions):
+            robot1, robot2 = robot_ids[i], robot_ids[j]
+
+            pos1 = next_positions[robot1]
+            pos2 = next_positions[robot2]
+            curr_pos1 = self.current_positions[robot1]
+            curr_pos2 = self.current_positions[robot2]
+
+            # Same cell collision - both trying to enter same cell
+            if pos1 == pos2:
+                colliding_robots[robot1] = "same_cell_collision"
+                colliding_robots[robot2] = "same_cell_collision"
+                collision_details.append({
+                    "type": "same_cell",
+                    "robots": [robot1, robot2],
+                    "position": pos1
+                })
+                continue
 
-                    # If moving in same direction (series/convoy), it's valid - no collision
-                    if (dx1, dy1) != (dx2, dy2):
-                        # Check if perpendicular (one moves horizontal, other vertical)
-                        if (dx1 == 0 and dy1 != 0 and dx2 != 0 and dy2 == 0) or \
-                           (dx1 != 0 and dy1 == 0 and dx2 == 0 and dy2 != 0):
-                            colliding_robots[robot1] = "shear_collision"
-                            colliding_robots[robot2] = "shear_collision"
-                            collision_details.append({
-                                "type": "shear",
-                                "robots": [robot1, robot2],
-                                "position": pos1
-                            })
-                            continue
-
-                # Check reverse case - robot2 entering robot1's current position
-                if pos2 == curr_pos1 and pos1 != curr_pos1:
-                    dx1 = pos1[0] - curr_pos1[0]
-                    dy1 = pos1[1] - curr_pos1[1]
-                    dx2 = pos2[0] - curr_pos2[0]
-                    dy2 = pos2[1] - curr_pos2[1]
+            # Swap collision - exchanging positions
+            if pos1 == curr_pos2 and pos2 == curr_pos1:
+                colliding_robots[robot1] = "swap_collision"
+                colliding_robots[robot2] = "swap_collision"
+                collision_details.append({
+                    "type": "swap",
+                    "robots": [robot1, robot2],
+                    "positions": [curr_pos1, curr_pos2]
+                })
+                continue
 
-                    # Same direction = valid
-                    if (dx1, dy1) != (dx2, dy2):
-                        # Perpendicular = shear collision
-                        if (dx1 == 0 and dy1 != 0 and dx2 != 0 and dy2 == 0) or \
-                           (dx1 != 0 and dy1 == 0 and dx2 == 0 and dy2 != 0):
-                            colliding_robots[robot1] = "shear_collision"
-                            colliding_robots[robot2] = "shear_collision"
-                            collision_details.append({
-                                "type": "shear",
-                                "robots": [robot1, robot2],
-                                "position": pos2
-                            })
-                            continue
-
-        # Pass 2: Iteratively detect blocked robot collisions
-        # Continue until no new collisions found
-        max_iterations = len(robot_ids)  # Safety limit
-        iteration = 0
-
-        while iteration < max_iterations:
-            new_collisions = {}
-
-            # Check each non-colliding robot
-            for robot_id in robot_ids:
-                if robot_id in colliding_robots:
-                    continue  # Already colliding
-
-                # Check if this robot's next position is blocked by a colliding robot
-                next_pos = next_positions[robot_id]
-
-                for blocked_id in colliding_robots:
-                    if self.current_positions[blocked_id] == next_pos:
-                        # This robot is trying to move into a blocked robot's position
-                        new_collisions[robot_id] = "blocked_robot_collision"
+            # Shear collision - perpendicular crossing
+            # Check if robot1 is entering robot2's current position
+            if pos1 == curr_pos2 and pos2 != curr_pos2:
+                # Calculate movement directions
+                dx1 = pos1[0] - curr_pos1[0]
+                dy1 = pos1[1] - curr_pos1[1]
+                dx2 = pos2[0] - curr_pos2[0]
+                dy2 = pos2[1] - curr_pos2[1]
+
+                # If moving in same direction (series/convoy), it's valid - no collision
+                if (dx1, dy1) != (dx2, dy2):
+                    # Check if perpendicular (one moves horizontal, other vertical)
+                    if (dx1 == 0 and dy1 != 0 and dx2 != 0 and dy2 == 0) or \
+                       (dx1 != 0 and dy1 == 0 and dx2 == 0 and dy2 != 0):
+                        colliding_robots[robot1] = "shear_collision"
+                        colliding_robots[robot2] = "shear_collision"
                         collision_details.append({
-                            "type": "blocked_robot",
-                            "robots": [robot_id],
-                            "blocked_by": blocked_id,
-                            "position": self.current_positions[blocked_id]
+                            "type": "shear",
+                            "robots": [robot1, robot2],
+                            "position": pos1
                         })
-                        break
-
-            if not new_collisions:
-                break  # No new collisions found
-
-            # Add new collisions to the set
-            colliding_robots.update(new_collisions)
-            iteration += 1
+                        continue
+
+            # Check reverse case - robot2 entering robot1's current position
+            if pos2 == curr_pos1 and pos1 != curr_pos1:
+                dx1 = pos1[0] - curr_pos1[0]
+                dy1 = pos1[1] - curr_pos1[1]
+                dx2 = pos2[0] - curr_pos2[0]
+                dy2 = pos2[1] - curr_pos2[1]
+
+                # Same direction = valid
+                if (dx1, dy1) != (dx2, dy2):
+                    # Perpendicular = shear collision
+                    if (dx1 == 0 and dy1 != 0 and dx2 != 0 and dy2 == 0) or \
+                       (dx1 != 0 and dy1 == 0 and dx2 == 0 and dy2 != 0):
+                        colliding_robots[robot1] = "shear_collision"
+                        colliding_robots[robot2] = "shear_collision"
+                        collision_details.append({
+                            "type": "shear",
+                            "robots": [robot1, robot2],
+                            "position": pos2
+                        })
+                        continue
+
+        # Pass 2: Propagate blocked robot collisions
+        # A robot is blocked when its next cell holds a colliding robot.
+        # Index waiting robots by next cell once, then spread outward from
+        # the colliding robots one wave at a time; each wave is handled in
+        # robot order, matching a rescan-until-no-change loop.
+        waiting = {}
+        for index, robot_id in enumerate(robot_ids):
+            if robot_id not in colliding_robots:
+                waiting.setdefault(next_positions[robot_id], []).append(index)
+
+        blocker_at = {}
+        wave = list(colliding_robots)
+        while wave and waiting:
+            reached = []
+            for blocked_id in wave:
+                cell = current_positions[blocked_id]
+                if cell not in blocker_at:
+                    blocker_at[cell] = blocked_id
+                    reached.extend(waiting.pop(cell, ()))
+
+            wave = []
+            for index in sorted(reached):
+                robot_id = robot_ids[index]
+                blocked_id = blocker_at[next_positions[robot_id]]
+                # This robot is trying to move into a blocked robot's position
+                colliding_robots[robot_id] = "blocked_robot_collision"
+                collision_details.append({
+                    "type": "blocked_robot",
+                    "robots": [robot_id],
+                    "blocked_by": blocked_id,
+                    "position": current_positions[blocked_id]
+                })
+                wave.append(robot_id)
 
         # Store collision details for later use
         self.collision_details = collision_details
@@ -229,6 +259,30 @@ class MultiAgentCoordinator:
 
         return colliding_robots
 
+    def _candidate_pairs(self, robot_ids: List[str],
+                         next_positions: Dict[str, Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Broadphase for pairwise collision checks.
+        Two robots can only collide if one's next cell is the other's next or
+        current cell. Hash cells to robot indices and return just those
+        (i, j) index pairs, i < j, in the order of a full pairwise scan.
+        """
+        current_positions = self.current_positions
+        by_next = {}
+        by_current = {}
+        for index, robot_id in enumerate(robot_ids):
+            by_next.setdefault(next_positions[robot_id], []).append(index)
+            by_current.setdefault(current_positions[robot_id], []).append(index)
+
+        candidate_pairs = set()
+        for i, robot_id in enumerate(robot_ids):
+            cell = next_positions[robot_id]
+            for j in by_next[cell] + by_current.get(cell, []):
+                if i != j:
+                    candidate_pairs.add((i, j) if i < j else (j, i))
+
+        return sorted(candidate_pairs)
+
     def detect_all_collisions_at_next_step(self, exclude_paused: bool = False) -> List[Tuple[str, str, str]]:
         """
         Check for ALL collisions that will occur in the next step.
@@ -258,151 +312,246 @@ class MultiAgentCoordinator:
                     # Robot stays at current position
                     next_positions[robot_id] = self.current_positions[robot_id]
 
-        # Check for collisions between pairs
-        for i in range(len(robot_ids)):
-            for j in range(i + 1, len(robot_ids)):
-                robot1, robot2 = robot_ids[i], robot_ids[j]
-
-                # Skip checking between two collision blocked robots
-                if exclude_paused and robot1 in self.collision_blocked_robots and robot2 in self.collision_blocked_robots:
-                    continue
-
-                pos1 = next_positions[robot1]
-                pos2 = next_positions[robot2]
-                curr_pos1 = self.current_positions[robot1]
-                curr_pos2 = self.current_positions[robot2]
-
-                # Same cell collision - both trying to enter same cell
-                if pos1 == pos2:
-                    collisions.append((robot1, robot2, 'same_cell'))
-                    continue
-
-                # Swap collision - exchanging positions
-                if pos1 == curr_pos2 and pos2 == curr_pos1:
-                    collisions.append((robot1, robot2, 'swap'))
-                    continue
-
-                # Shear collision - one robot enters cell that another is leaving perpendicularly
-                # Check if robot1 is entering robot2's current position
-                if pos1 == curr_pos2:
-                    # Robot2 must be moving (not stationary)
-                    if pos2 != curr_pos2:
-                        # Calculate movement directions
-                        dx1 = pos1[0] - curr_pos1[0]
-                        dy1 = pos1[1] - curr_pos1[1]
-                        dx2 = pos2[0] - curr_pos2[0]
-                        dy2 = pos2[1] - curr_pos2[1]
-
-                        # If moving in same direction (series/convoy), it's valid - no collision
-                        if (dx1, dy1) == (dx2, dy2):
-                            continue
-
-                        # Check if perpendicular (one moves horizontal, other vertical)
-                        # This is a shear collision
-                        if (dx1 == 0 and dy1 != 0 and dx2 != 0 and dy2 == 0) or \
-                           (dx1 != 0 and dy1 == 0 and dx2 == 0 and dy2 != 0):
-                            collisions.append((robot1, robot2, 'shear'))
-                            continue
-
-                # Check reverse case - robot2 entering robot1's current position
-                if pos2 == curr_pos1:
-                    # Robot1 must be moving
-                    if pos1 != curr_pos1:
-                        dx1 = pos1[0] - curr_pos1[0]
-                        dy1 = pos1[1] - curr_pos1[1]
-                        dx2 = pos2[0] - curr_pos2[0]
-                        dy2 = pos2[1] - curr_pos2[1]
-
-                        # Same direction = valid
-                        if (dx1, dy1) == (dx2, dy2):
-                            continue
-
-                        # Perpendicular = shear collision
-                        if (dx1 == 0 and dy1 != 0 and dx2 != 0 and dy2 == 0) or \
-                           (dx1 != 0 and dy1 == 0 and dx2 == 0 and dy2 != 0):
-                            collisions.append((robot2, robot1, 'shear'))
-                            continue
+        # Check for collisions between candidate pairs
+        for i, j in self._candidate_pairs(robot_ids, next_positions):
+            robot1, robot2 = robot_ids[i], robot_ids[j]
+
+            # Skip checking between two collision blocked robots
+            if exclude_paused and robot1 in self.collision_blocked_robots and robot2 in self.collision_blocked_robots:
+                continue
+
+            pos1 = next_positions[robot1]
+            pos2 = next_positions[robot2]
+            curr_pos1 = self.current_positions[robot1]
+            curr_pos2 = self.current_positions[robot2]
+
+            # Same cell collision - both trying to enter same cell
+            if pos1 == pos2:
+                collisions.append((robot1, robot2, 'same_cell'))
+                continue
+
+            # Swap collision - exchanging positions
+            if pos1 == curr_pos2 and pos2 == curr_pos1:
+                collisions.append((robot1, robot2, 'swap'))
+                continue
+
+            # Shear collision - one robot enters cell that another is leaving perpendicularly
+            # Check if robot1 is entering robot2's current position
+            if pos1 == curr_pos2:
+                # Robot2 must be moving (not stationary)
+                if pos2 != curr_pos2:
+                    # Calculate movement directions
+                    dx1 = pos1[0] - curr_pos1[0]
+                    dy1 = pos1[1] - curr_pos1[1]
+                    dx2 = pos2[0] - curr_pos2[0]
+                    dy2 = pos2[1] - curr_pos2[1]
+
+                    # If moving in same direction (series/convoy), it's valid - no collision
+                    if (dx1, dy1) == (dx2, dy2):
+                        continue
+
+                    # Check if perpendicular (one moves horizontal, other vertical)
+                    # This is a shear collision
+                    if (dx1 == 0 and dy1 != 0 and dx2 != 0 and dy2 == 0) or \
+                       (dx1 != 0 and dy1 == 0 and dx2 == 0 and dy2 != 0):
+                        collisions.append((robot1, robot2, 'shear'))
+                        continue
+
+            # Check reverse case - robot2 entering robot1's current position
+            if pos2 == curr_pos1:
+                # Robot1 must be moving
+                if pos1 != curr_pos1:
+                    dx1 = pos1[0] - curr_pos1[0]
+                    dy1 = pos1[1] - curr_pos1[1]
+                    dx2 = pos2[0] - curr_pos2[0]
+                    dy2 = pos2[1] - curr_pos2[1]
+
+                    # Same direction = valid
+                    if (dx1, dy1) == (dx2, dy2):
+                        continue
+
+                    # Perpendicular = shear collision
+                    if (dx1 == 0 and dy1 != 0 and dx2 != 0 and dy2 == 0) or \
+                       (dx1 != 0 and dy1 == 0 and dx2 == 0 and dy2 != 0):
+                        collisions.append((robot2, robot1, 'shear'))
+                        continue
 
         return collisions
 
     def recompute_paths(self, changed_cells: Set[Tuple[int, int]] = None,
-                       treat_paused_as_obstacles: bool = False):
+                       treat_paused_as_obstacles: bool = False,
+                       robot_ids: Optional[Iterable[str]] = None):
         """
         Recompute paths for all robots.
         Each robot sees others as obstacles at their current positions.
 
+        Obstacles added or removed on the world directly since a planner last
+        replanned are found by diffing the world against what that planner
+        has seen, so a bare call repairs D* Lite state locally instead of
+        relying on a full replan. Without changed_cells, robots whose planner
+        has already seen the current obstacles keep their paths, so repeated
+        calls on an unchanged world do no planning.
+
         Args:
-            changed_cells: Set of (x, y) cells that have changed (obstacles added/removed)
+            changed_cells: Extra (x, y) cells to treat as changed (obstacles
+                added/removed); merged with the cells found by the diff
             treat_paused_as_obstacles: If True, treat paused robots as obstacles
-        """
-        # Store original robot positions if treating blocked as obstacles
+            robot_ids: Only replan these robots (default: all). Only safe when
+                nothing the other robots' planners depend on has changed.
+        """
+        # Collect blocked robot cells once; planners then see them through
+        # the world's obstacle set, a single hash probe per expanded node.
+        # Cells that are already real obstacles are left alone so they
+        # survive the cleanup below.
+        temp_obstacles = frozenset()
         if treat_paused_as_obstacles:
+            current_positions = self.current_positions
+            temp_obstacles = frozenset(
+                current_positions[robot_id] for robot_id in self.collision_blocked_robots
+            ) - self.world.static_obstacles
             # Temporarily add collision blocked robots as obstacles
-            for robot_id in self.collision_blocked_robots:
-                pos = self.current_positions[robot_id]
-                self.world.add_obstacle(pos[0], pos[1])
+            for x, y in temp_obstacles:
+                self.world.add_obstacle(x, y)
+
+        # Note: We DO replan for paused robots when obstacles change
+        # This allows collision resolution via obstacle placement
+        robot_ids = list(self.planners if robot_ids is None else robot_ids)
+        obstacles = self._snapshot_obstacles()
+        if not changed_cells:
+            # A robot planned against exactly these obstacles already has
+            # the path a replan would give it
+            known_obstacles = self._known_obstacles
+            robot_ids = [robot_id for robot_id in robot_ids
+                         if known_obstacles.get(robot_id) is not obstacles]
+        changes = [self._unseen_changes(robot_id, obstacles, changed_cells)
+                   for robot_id in robot_ids]
+        if self.parallel_planning and len(robot_ids) > 1:
+            with ThreadPoolExecutor() as executor:
+                new_paths = executor.map(self._replan_robot, robot_ids, changes)
+                self.paths.update(zip(robot_ids, new_paths))
+        else:
+            for robot_id, robot_changes in zip(robot_ids, changes):
+                self.paths[robot_id] = self._replan_robot(robot_id, robot_changes)
 
-        for robot_id in self.planners.keys():
-            planner = self.planners[robot_id]
+        # Remove temporary obstacles
+        for x, y in temp_obstacles:
+            self.world.remove_obstacle(x, y)
 
-            # Note: We DO replan for paused robots when obstacles change
-            # This allows collision resolution via obstacle placement
+        # Update stuck robots after recomputing paths
+        self.detect_stuck_robots()
 
-            # If cells have changed, inform the planner
-            if changed_cells:
-                planner.update_edge_costs(changed_cells)
+    def recompute_paths_incremental(self, blocked_cells: Set[Tuple[int, int]]):
+        """
+        Replan only robots whose current path crosses newly blocked cells.
+        Blocking cells can only raise costs, so a full path to the goal that
+        avoids all of them stays optimal; those planners just queue the change
+        for their next search. Use recompute_paths() when cells were freed.
 
-            # Recompute path
-            success, reason = planner.compute_shortest_path()
+        Args:
+            blocked_cells: Set of (x, y) cells that just became obstacles
+        """
+        obstacles = self._snapshot_obstacles()
+        for robot_id, planner in self.planners.items():
+            # Only a full path planned on the previous snapshot can be kept:
+            # changes this planner hadn't seen yet may include freed cells
+            # (e.g. direct world edits or lifted temporary obstacles), which
+            # can shorten any path
+            changes = self._unseen_changes(robot_id, obstacles, blocked_cells)
+            path = self.paths.get(robot_id)
+            if (path and path[-1] == self.goals[robot_id]
+                    and changes <= blocked_cells
+                    and self.world.is_path_free(path)):
+                planner.update_edge_costs(changes)
+            else:
+                self.paths[robot_id] = self._replan_robot(robot_id, changes)
 
-            # Try complete replan for any failure type (not just no_path_exists)
-            if not success:
-                print(f"Robot {robot_id}: Path computation failed ({reason}), attempting complete replan...")
-                # Reinitialize the planner completely
-                current_pos = self.current_positions[robot_id]
-                goal = self.goals[robot_id]
-                planner.initialize(current_pos, goal)
-                # Try again with fresh state
-                success, reason = planner.compute_shortest_path()
-                if success:
-                    print(f"Robot {robot_id}: Complete replan successful after {reason} failure!")
-                else:
-                    print(f"Robot {robot_id}: Complete replan also failed - {reason}")
+        # Update stuck robots after recomputing paths
+        self.detect_stuck_robots()
 
+    def _snapshot_obstacles(self) -> FrozenSet[Tuple[int, int]]:
+        """
+        Return a frozen copy of the world's obstacles, reusing the previous
+        snapshot while they are unchanged so planners that are up to date
+        can be recognised by identity.
+        """
+        if self.world.static_obstacles != self._obstacles:
+            self._obstacles = frozenset(self.world.static_obstacles)
+        return self._obstacles
+
+    def _unseen_changes(self, robot_id: str, obstacles: FrozenSet[Tuple[int, int]],
+                        changed_cells: Set[Tuple[int, int]] = None) -> Set[Tuple[int, int]]:
+        """
+        Return the cells whose obstacle state differs between the given
+        snapshot and what robot_id's planner last saw, plus changed_cells,
+        and record the snapshot as seen.
+        """
+        known = self._known_obstacles.get(robot_id, obstacles)  # Fresh planner
+        self._known_obstacles[robot_id] = obstacles
+        changes = set() if known is obstacles else set(known ^ obstacles)
+        if changed_cells:
+            changes.update(changed_cells)
+        return changes
+
+    def _replan_robot(self, robot_id: str,
+                      changed_cells: Set[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
+        """
+        Replan a single robot and return its new path (empty if none found).
+        Only touches this robot's planner, so robots can be replanned independently.
+        """
+        planner = self.planners[robot_id]
+
+        # If cells have changed, inform the planner
+        if changed_cells:
+            planner.update_edge_costs(changed_cells)
+
+        # Recompute path
+        success, reason = planner.compute_shortest_path()
+
+        # An obstacle on the goal makes every search fail; keep the planner's
+        # incremental state so removing the obstacle repairs it locally
+        if not success and self.goals[robot_id] in self.world.static_obstacles:
+            logger.warning(f"No path found for robot {robot_id} - Reason: goal blocked by obstacle")
+            return []
+
+        # Try complete replan for any failure type (not just no_path_exists)
+        if not success:
+            logger.warning(f"Robot {robot_id}: Path computation failed ({reason}), attempting complete replan...")
+            # Reinitialize the planner completely
+            current_pos = self.current_positions[robot_id]
+            goal = self.goals[robot_id]
+            planner.initialize(current_pos, goal)
+            # Try again with fresh state
+            success, reason = planner.compute_shortest_path()
             if success:
-                new_path = planner.get_path()
-                if new_path:
-                    self.paths[robot_id] = new_path
-                else:
-                    # Path extraction failed despite successful compute - try complete replan
-                    print(f"Warning: Failed to extract path for robot {robot_id}, attempting complete replan...")
-                    current_pos = self.current_positions[robot_id]
-                    goal = self.goals[robot_id]
-                    planner.initialize(current_pos, goal)
-                    success, reason = planner.compute_shortest_path()
-                    if success:
-                        new_path = planner.get_path()
-                        if new_path:
-                            print(f"Robot {robot_id}: Path extraction successful after replan!")
-                            self.paths[robot_id] = new_path
-                        else:
-                            print(f"Warning: Path extraction still failed for robot {robot_id} after replan")
-                            self.paths[robot_id] = []
-                    else:
-                        print(f"Warning: Replan failed for robot {robot_id} - {reason}")
-                        self.paths[robot_id] = []
+                logger.info(f"Robot {robot_id}: Complete replan successful after {reason} failure!")
             else:
-                print(f"Warning: No path found for robot {robot_id} - Reason: {reason}")
-                self.paths[robot_id] = []
+                logger.warning(f"Robot {robot_id}: Complete replan also failed - {reason}")
 
-        # Remove temporary obstacles
-        if treat_paused_as_obstacles:
-            for robot_id in self.collision_blocked_robots:
-                pos = self.current_positions[robot_id]
-                self.world.remove_obstacle(pos[0], pos[1])
+        if not success:
+            logger.warning(f"No path found for robot {robot_id} - Reason: {reason}")
+            return []
 
-        # Update stuck robots after recomputing paths
-        self.detect_stuck_robots()
+        new_path = planner.get_path()
+        if new_path:
+            return new_path
+
+        # Path extraction failed despite successful compute - try complete replan
+        logger.warning(f"Failed to extract path for robot {robot_id}, attempting complete replan...")
+        current_pos = self.current_positions[robot_id]
+        goal = self.goals[robot_id]
+        planner.initialize(current_pos, goal)
+        success, reason = planner.compute_shortest_path()
+        if not success:
+            logger.warning(f"Replan failed for robot {robot_id} - {reason}")
+            return []
+
+        new_path = planner.get_path()
+        if new_path:
+            logger.info(f"Robot {robot_id}: Path extraction successful after replan!")
+            return new_path
+
+        logger.warning(f"Path extraction still failed for robot {robot_id} after replan")
+        return []
 
     def detect_stuck_robots(self) -> set:
         """
@@ -414,37 +563,76 @@ class MultiAgentCoordinator:
         stuck = set()
         goal_blocked = set()
 
-        for robot_id in self.planners:
-            current_pos = self.current_positions[robot_id]
-            goal_pos = self.goals[robot_id]
+        # Obstacles can be edited on the world directly, so every robot is
+        # rechecked; bind the per-robot lookups once
+        goals = self.goals
+        paths = self.paths
+        static_obstacles = self.world.static_obstacles
+        for robot_id, current_pos in self.current_positions.items():
+            goal_pos = goals[robot_id]
 
             # If at goal, not stuck
             if current_pos == goal_pos:
                 continue
 
             # Check if goal is blocked by obstacle
-            if goal_pos in self.world.static_obstacles:
+            if goal_pos in static_obstacles:
                 goal_blocked.add(robot_id)
                 stuck.add(robot_id)  # Also add to stuck for backward compatibility
                 continue
 
-            # If no path, empty path, or path only contains current position, robot is stuck
-            path = self.paths.get(robot_id, [])
-            if not path or len(path) == 0 or (len(path) == 1 and path[0] == current_pos):
+            # If no path, or path only contains current position, robot is stuck
+            path = paths.get(robot_id)
+            if not path or (len(path) == 1 and path[0] == current_pos):
                 stuck.add(robot_id)
 
         self.stuck_robots = stuck
         self.goal_blocked_robots = goal_blocked
         return stuck
 
-    def step_simulation(self) -> Tuple[bool, Optional[Tuple[str, str, str]], List[str], Dict[str, str]]:
+    def step_simulation(self, steps: int = 1) -> Tuple[bool, Optional[Tuple[str, str, str]], FrozenSet[str], Dict[str, str]]:
         """
         Move all robots one step along their paths.
         Returns (should_continue, collision_info, stuck_robots, collision_blocked_robots).
         should_continue is False if all robots are at goal.
         collision_info is None or (robot1, robot2, collision_type) if collision would occur.
-        stuck_robots is a list of robot IDs that have no valid path but are not at goal.
+        stuck_robots is a frozenset of robot IDs that have no valid path but are not at goal.
         collision_blocked_robots is a dict of robot_id -> block reason.
+
+        Args:
+            steps: Number of steps to run. Stops early once should_continue is
+                False, since further steps would not change anything. Returns
+                the result of the last step run.
+        """
+        result = self._step_once()
+        for _ in range(steps - 1):
+            if not result[0]:
+                break
+            result = self._step_once()
+        return result
+
+    def run_until(self, predicate: Callable[[tuple], bool],
+                  max_steps: int = 16) -> Tuple[bool, Optional[Tuple[str, str, str]], FrozenSet[str], Dict[str, str]]:
+        """
+        Step the simulation until predicate(result) is true.
+        Replaces 'for _ in range(n): step_simulation(); if ...: break'
+        loops. Also stops when all robots are at their goals or after
+        max_steps steps.
+
+        Returns:
+            The step_simulation() result of the last step run
+        """
+        step_once = self._step_once
+        result = step_once()
+        for _ in range(max_steps - 1):
+            if not result[0] or predicate(result):
+                break
+            result = step_once()
+        return result
+
+    def _step_once(self) -> Tuple[bool, Optional[Tuple[str, str, str]], FrozenSet[str], Dict[str, str]]:
+        """
+        Run a single simulation step; see step_simulation().
         """
         # Calculate all collisions using the new iterative method
         new_collisions = self.calculate_collisions()
@@ -461,18 +649,25 @@ class MultiAgentCoordinator:
 
         any_robot_moving = False
 
-        # Detect stuck robots (updates self.stuck_robots)
-        self.detect_stuck_robots()
-        stuck_robots = list(self.stuck_robots)
+        # Detect stuck robots (updates self.stuck_robots); frozen so callers
+        # get O(1) membership checks on a snapshot
+        stuck_robots = frozenset(self.detect_stuck_robots())
 
         # Move all non-blocked robots one step along their current paths
-        for robot_id, path in self.paths.items():
+        # Bind per-step lookups to locals once instead of per robot
+        blocked = new_collisions
+        current_positions = self.current_positions
+        goals = self.goals
+        paths = self.paths
+        known_obstacles = self._known_obstacles
+        obstacles = self._snapshot_obstacles()
+        for robot_id, path in paths.items():
             # Skip collision blocked robots
-            if robot_id in self.collision_blocked_robots:
+            if robot_id in blocked:
                 continue
 
-            current_pos = self.current_positions[robot_id]
-            goal_pos = self.goals[robot_id]
+            current_pos = current_positions[robot_id]
+            goal_pos = goals[robot_id]
 
             # Check if at goal
             if current_pos == goal_pos:
@@ -490,16 +685,22 @@ class MultiAgentCoordinator:
                 new_pos = path[1]
 
                 # Update positions
-                self.current_positions[robot_id] = new_pos
+                current_positions[robot_id] = new_pos
                 self.world.robot_positions[robot_id] = new_pos
 
                 # Update planner's start position
                 self.planners[robot_id].start = new_pos
 
-                # Remove the first element from path since we moved
-                self.paths[robot_id] = path[1:]
+                if known_obstacles.get(robot_id) is obstacles:
+                    # Map unchanged since this path was planned: the rest of
+                    # a shortest path is still shortest, so skip the search
+                    paths[robot_id] = path[1:]
 
-        # After moving, recompute paths from new positions
+        # Replan every robot whose planner hasn't seen the current obstacles:
+        # robots that moved onto a changed map, stuck robots (no path, or one
+        # that ends at their own cell) and robots that stayed put while the
+        # world was edited. recompute_paths() skips the rest - their paths
+        # are current, or they would just fail again
         if any_robot_moving or stuck_robots:
             self.recompute_paths()
 
@@ -519,13 +720,14 @@ class MultiAgentCoordinator:
         # Check if position has a robot
         for robot_id, pos in self.current_positions.items():
             if pos == (x, y):
-                print(f"Cannot place obstacle at {(x,y)}: Robot {robot_id} is there")
+                logger.warning(f"Cannot place obstacle at {(x,y)}: Robot {robot_id} is there")
                 return False
 
         self.world.add_obstacle(x, y)
 
-        # Pass the changed cell so D* Lite can update properly
-        self.recompute_paths(changed_cells={(x, y)})
+        # Pass the changed cell so D* Lite can update properly; robots whose
+        # paths avoid it keep them
+        self.recompute_paths_incremental({(x, y)})
 
         # Collisions will be recalculated on next step with new paths
         return True
@@ -547,21 +749,25 @@ class MultiAgentCoordinator:
         Returns True if successful, False if goal is invalid.
         """
         if robot_id not in self.planners:
-            print(f"Warning: Robot {robot_id} not found")
+            logger.warning(f"Robot {robot_id} not found")
             return False
 
         # Validation: Check if goal is on an obstacle
         if new_goal in self.world.static_obstacles:
-            print(f"Cannot set goal at {new_goal}: Position has an obstacle")
+            logger.warning(f"Cannot set goal at {new_goal}: Position has an obstacle")
             return False
 
         # Validation: Check if goal conflicts with another robot's goal
-        for other_robot_id, other_goal in self.goals.items():
-            if other_robot_id != robot_id and other_goal == new_goal:
-                print(f"Cannot set goal at {new_goal}: Another robot ({other_robot_id}) has this goal")
-                return False
+        old_goal = self.goals[robot_id]
+        if self._goal_counts.get(new_goal, 0) > (old_goal == new_goal):
+            for other_robot_id, other_goal in self.goals.items():
+                if other_robot_id != robot_id and other_goal == new_goal:
+                    logger.warning(f"Cannot set goal at {new_goal}: Another robot ({other_robot_id}) has this goal")
+                    return False
 
         # Update the goal
+        self._track_goal(old_goal, -1)
+        self._track_goal(new_goal, 1)
         self.goals[robot_id] = new_goal
 
         # Unblock the robot if it was collision blocked (goal change is user intervention)
@@ -572,13 +778,17 @@ class MultiAgentCoordinator:
         planner = self.planners[robot_id]
         current_pos = self.current_positions[robot_id]
 
-        # Reinitialize the planner with new goal
+        # Reinitialize the planner with new goal - g/rhs are distances to
+        # the goal, so they can't be carried over to a different goal
         planner.initialize(current_pos, new_goal)
+        # Forget the old snapshot so the replan below isn't skipped as
+        # up to date
+        del self._known_obstacles[robot_id]
 
-        # Recompute all paths
-        self.recompute_paths()
+        # Other robots' goals and the map are unchanged; only replan this robot
+        self.recompute_paths(robot_ids=[robot_id])
 
-        print(f"Set new goal for {robot_id}: {new_goal}")
+        logger.info(f"Set new goal for {robot_id}: {new_goal}")
         return True
 
     def change_robot_planner(self, robot_id: str, planner_name: str) -> bool:
@@ -593,12 +803,12 @@ class MultiAgentCoordinator:
             True if successful, False otherwise
         """
         if robot_id not in self.planners:
-            print(f"Warning: Robot {robot_id} not found")
+            logger.warning(f"Robot {robot_id} not found")
             return False
 
         planner_class = get_planner_class(planner_name)
         if not planner_class:
-            print(f"Warning: Unknown planner {planner_name}")
+            logger.warning(f"Unknown planner {planner_name}")
             return False
 
         # Create new planner with current position and goal
@@ -611,6 +821,7 @@ class MultiAgentCoordinator:
         # Replace the planner
         self.planners[robot_id] = new_planner
         self.robot_algorithms[robot_id] = planner_name
+        self._known_obstacles[robot_id] = self._snapshot_obstacles()
 
         # Recompute path with new planner
         success, reason = new_planner.compute_shortest_path()
@@ -618,9 +829,9 @@ class MultiAgentCoordinator:
             self.paths[robot_id] = new_planner.get_path()
         else:
             self.paths[robot_id] = []
-            print(f"Warning: No path found with {planner_name} for {robot_id} - {reason}")
+            logger.warning(f"No path found with {planner_name} for {robot_id} - {reason}")
 
-        print(f"Changed {robot_id} to use {planner_name} algorithm")
+        logger.info(f"Changed {robot_id} to use {planner_name} algorithm")
         return True
 
     def remove_robot(self, robot_id: str) -> bool:
@@ -629,14 +840,15 @@ class MultiAgentCoordinator:
         Returns True if successful, False if robot doesn't exist.
         """
         if robot_id not in self.planners:
-            print(f"Warning: Robot {robot_id} not found")
+            logger.warning(f"Robot {robot_id} not found")
             return False
 
         # Remove from all tracking dictionaries
         del self.planners[robot_id]
         del self.current_positions[robot_id]
-        del self.goals[robot_id]
+        self._track_goal(self.goals.pop(robot_id), -1)
         del self.robot_algorithms[robot_id]
+        del self._known_obstacles[robot_id]
 
         if robot_id in self.paths:
             del self.paths[robot_id]
@@ -644,13 +856,24 @@ class MultiAgentCoordinator:
         if robot_id in self.world.robot_positions:
             del self.world.robot_positions[robot_id]
 
-        print(f"Removed robot {robot_id}")
+        logger.info(f"Removed robot {robot_id}")
 
         # Recompute paths for remaining robots
         self.recompute_paths()
 
         return True
 
+    def _track_goal(self, goal: Tuple[int, int], delta: int):
+        """
+        Adjust how many robots target a goal cell, keeping set_new_goal's
+        conflict check a single lookup instead of a scan over all goals.
+        """
+        count = self._goal_counts.get(goal, 0) + delta
+        if count:
+            self._goal_counts[goal] = count
+        else:
+            del self._goal_counts[goal]
+
     def get_next_robot_id(self) -> Optional[str]:
         """
         Generate the next available robot ID.
@@ -679,10 +902,12 @@ class MultiAgentCoordinator:
         self.paths.clear()
         self.current_positions.clear()
         self.goals.clear()
+        self._goal_counts.clear()
         self.robot_algorithms.clear()
+        self._known_obstacles.clear()
         self.world.robot_positions.clear()
 
-        print("Cleared all robots")
+        logger.info("Cleared all robots")
 
     def resize_world(self, new_width: int, new_height: int):
         """
@@ -694,10 +919,9 @@ class MultiAgentCoordinator:
 
         # Resize and clear the world
         self.world.resize(new_width, new_height)
-        self.world.static_obstacles.clear()
-        self.world.grid.fill(0)  # All empty cells
+        self.world.reset()
 
-        print(f"Resized world to {new_width}x{new_height} - Clean slate")
+        logger.info(f"Resized world to {new_width}x{new_height} - Clean slate")
 
     def reset_to_default(self):
         """
@@ -705,6 +929,27 @@ class MultiAgentCoordinator:
         """
         self.resize_world(10, 10)
 
+    def reset(self):
+        """
+        Reset to a clean slate at the current world size.
+        Clears robots, obstacles and all collision/stuck state in place,
+        so a coordinator can be reused without reallocating the world.
+        """
+        self.planners.clear()
+        self.paths.clear()
+        self.current_positions.clear()
+        self.goals.clear()
+        self._goal_counts.clear()
+        self.robot_algorithms.clear()
+        self._known_obstacles.clear()
+
+        self.collision_blocked_robots = {}
+        self.collision_details = []
+        self.stuck_robots = set()
+        self.goal_blocked_robots = set()
+
+        self.world.reset()
+
     def get_robot_at_position(self, position: Tuple[int, int]) -> Optional[str]:
         """
         Get the robot at the given position, or None if no robot there.
@@ -719,12 +964,15 @@ class MultiAgentCoordinator:
         Get current status of all robots for debugging.
         """
         status = {}
-        for robot_id in self.planners.keys():
+        goals = self.goals
+        paths = self.paths
+        for robot_id, current in self.current_positions.items():
+            goal = goals[robot_id]
             status[robot_id] = {
-                'current': self.current_positions[robot_id],
-                'goal': self.goals[robot_id],
-                'path_length': len(self.paths[robot_id]) if self.paths[robot_id] else 0,
-                'at_goal': self.current_positions[robot_id] == self.goals[robot_id]
+                'current': current,
+                'goal': goal,
+                'path_length': len(paths[robot_id]),
+                'at_goal': current == goal
             }
         return status
 
@@ -744,9 +992,13 @@ class MultiAgentCoordinator:
         """Check if a robot is collision blocked."""
         return robot_id in self.collision_blocked_robots
 
-    def get_collision_blocked_robots(self) -> List[str]:
-        """Get list of all collision blocked robots."""
-        return list(self.collision_blocked_robots.keys())
+    def get_collision_blocked_robots(self) -> KeysView[str]:
+        """
+        Get all collision blocked robots as a keys view (no copy).
+        step_simulation() replaces the underlying dict, so call again after
+        stepping; wrap in list() if a snapshot is needed.
+        """
+        return self.collision_blocked_robots.keys()
 
     def get_block_reason(self, robot_id: str) -> Optional[str]:
         """Get the reason why a robot is collision blocked."""
@@ -14,6 +14,8 @@ class PathPlanner(ABC):
     compatibility with the multi-agent coordinator.
     """
 
+    __slots__ = ("world", "robot_id", "start", "goal")
+
     def __init__(self, world, robot_id: str):
         """
         Initialize the path planner.
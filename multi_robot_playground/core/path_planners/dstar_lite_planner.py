@@ -1,7 +1,10 @@
-import heapq
+import logging
 from typing import Tuple, List, Set, Optional, Dict
 from collections import defaultdict
 from .base_planner import PathPlanner
+from .indexed_heap import IndexedHeap
+
+logger = logging.getLogger(__name__)
 
 
 class DStarLitePlanner(PathPlanner):
@@ -16,6 +19,8 @@ class DStarLitePlanner(PathPlanner):
     Uses Manhattan distance heuristic for 4-connected grid.
     """
 
+    __slots__ = ("g", "rhs", "km", "open_list", "last_start")
+
     def __init__(self, world, robot_id: str):
         super().__init__(world, robot_id)
 
@@ -23,8 +28,7 @@ class DStarLitePlanner(PathPlanner):
         self.g = defaultdict(lambda: float('inf'))
         self.rhs = defaultdict(lambda: float('inf'))
         self.km = 0  # Key modifier for maintaining priority queue consistency
-        self.open_list = []  # Priority queue
-        self.open_set = set()  # For quick membership testing
+        self.open_list = IndexedHeap()  # Priority queue with in-place key updates
         self.last_start = None
 
     def calculate_key(self, s: Tuple[int, int]) -> Tuple[float, float]:
@@ -51,23 +55,24 @@ class DStarLitePlanner(PathPlanner):
         This is called whenever a vertex's rhs value changes.
         """
         if s != self.goal:
-            # Recalculate rhs as minimum cost from successors
-            self.rhs[s] = float('inf')
+            # Recalculate rhs as minimum cost from successors. Neighbors are
+            # always in bounds, so is_free() reduces to the obstacle probe
+            best = float('inf')
+            g = self.g
+            obstacles = self.world.static_obstacles
             for nx, ny, cost in self.world.get_neighbors(s[0], s[1]):
                 neighbor = (nx, ny)
-                if self.world.is_free(nx, ny, self.robot_id):
-                    self.rhs[s] = min(self.rhs[s], cost + self.g[neighbor])
-
-        # Remove from queue if present
-        if s in self.open_set:
-            self.open_set.remove(s)
-            # Mark heap for cleanup (we'll ignore removed items when popping)
+                if neighbor not in obstacles:
+                    candidate = cost + g[neighbor]
+                    if candidate < best:
+                        best = candidate
+            self.rhs[s] = best
 
-        # Add back if inconsistent
+        # Insert or re-key if inconsistent, otherwise drop from queue
         if self.g[s] != self.rhs[s]:
-            key = self.calculate_key(s)
-            heapq.heappush(self.open_list, (key, s))
-            self.open_set.add(s)
+            self.open_list.push(s, self.calculate_key(s))
+        else:
+            self.open_list.remove(s)
 
     def compute_shortest_path(self):
         """
@@ -84,63 +89,46 @@ class DStarLitePlanner(PathPlanner):
             if iterations > max_iterations:
                 return False, f"max_iterations_exceeded ({max_iterations})"
 
-            # Get vertex with minimum key
-            while self.open_list:
-                key, u = heapq.heappop(self.open_list)
-                if u in self.open_set:
-                    self.open_set.remove(u)
-                    break
-            else:
-                break  # Open list is empty
+            # Peek at the vertex with minimum key; it is only removed once
+            # it is processed, so stopping early leaves it queued
+            key, u = self.open_list.top()
 
             # Check if we're done
             if (key >= self.calculate_key(self.start) and
                 self.rhs[self.start] == self.g[self.start]):
                 return True, "path_found"
 
+            self.open_list.pop()
+
             k_old = key
             k_new = self.calculate_key(u)
 
             if k_old < k_new:
                 # Key increased, re-insert with new key
-                heapq.heappush(self.open_list, (k_new, u))
-                self.open_set.add(u)
+                self.open_list.push(u, k_new)
             elif self.g[u] > self.rhs[u]:
                 # Overconsistent - lower g value
                 self.g[u] = self.rhs[u]
 
                 # Update all predecessors
+                obstacles = self.world.static_obstacles
                 for nx, ny, cost in self.world.get_neighbors(u[0], u[1]):
                     neighbor = (nx, ny)
-                    if self.world.is_free(nx, ny, self.robot_id):
+                    if neighbor not in obstacles:
                         self.update_vertex(neighbor)
             else:
                 # Underconsistent - raise g value
-                g_old = self.g[u]
                 self.g[u] = float('inf')
 
-                # Update u and predecessors that depended on old g value
-                predecessors = [u]
+                # Update u and its predecessors; update_vertex recomputes
+                # each rhs from current g values, so any that routed
+                # through u's old g value pick up the change there
+                self.update_vertex(u)
+                obstacles = self.world.static_obstacles
                 for nx, ny, cost in self.world.get_neighbors(u[0], u[1]):
                     neighbor = (nx, ny)
-                    if self.world.is_free(nx, ny, self.robot_id):
-                        predecessors.append(neighbor)
-
-                for s in predecessors:
-                    # Check if this predecessor was using the old path through u
-                    # Need to recalculate cost from this predecessor to u
-                    for nnx, nny, ncost in self.world.get_neighbors(s[0], s[1]):
-                        if (nnx, nny) == u and self.world.is_free(nnx, nny, self.robot_id):
-                            if abs(self.rhs[s] - (ncost + g_old)) < 1e-9:  # Floating point comparison
-                                if s != self.goal:
-                                    # Recalculate rhs
-                                    self.rhs[s] = float('inf')
-                                    for nnnx, nnny, nncost in self.world.get_neighbors(s[0], s[1]):
-                                        nn = (nnnx, nnny)
-                                        if self.world.is_free(nnnx, nnny, self.robot_id):
-                                            self.rhs[s] = min(self.rhs[s], nncost + self.g[nn])
-                                break
-                    self.update_vertex(s)
+                    if neighbor not in obstacles:
+                        self.update_vertex(neighbor)
 
         # Check final state
         if self.g[self.start] == float('inf'):
@@ -163,14 +151,11 @@ class DStarLitePlanner(PathPlanner):
         # Clear previous search
         self.g.clear()
         self.rhs.clear()
-        self.open_list = []
-        self.open_set = set()
+        self.open_list.clear()
 
         # Set goal vertex
         self.rhs[goal] = 0
-        key = self.calculate_key(goal)
-        heapq.heappush(self.open_list, (key, goal))
-        self.open_set.add(goal)
+        self.open_list.push(goal, self.calculate_key(goal))
 
     def update_edge_costs(self, changed_cells: Set[Tuple[int, int]]):
         """
@@ -205,32 +190,35 @@ class DStarLitePlanner(PathPlanner):
 
         path = [self.start]
         current = self.start
-
-        max_steps = self.world.width * self.world.height
-        steps = 0
+        # Stale g-values can make the descent cycle (e.g. between two cells);
+        # stop at the first revisit instead of walking the whole grid
+        visited = {current}
+        g = self.g
+        obstacles = self.world.static_obstacles
+        get_neighbors = self.world.get_neighbors
 
         while current != self.goal:
-            steps += 1
-            if steps > max_steps:
-                print(f"Warning: Path extraction exceeded max steps for robot {self.robot_id}")
-                return []
-
             # Find neighbor with minimum g-value
             best_neighbor = None
             best_cost = float('inf')
 
-            for nx, ny, cost in self.world.get_neighbors(current[0], current[1]):
+            for nx, ny, cost in get_neighbors(current[0], current[1]):
                 neighbor = (nx, ny)
-                if self.world.is_free(nx, ny, self.robot_id):
-                    total_cost = cost + self.g[neighbor]
+                if neighbor not in obstacles:
+                    total_cost = cost + g[neighbor]
                     if total_cost < best_cost:
                         best_cost = total_cost
                         best_neighbor = neighbor
 
             if best_neighbor is None or best_neighbor == current:
-                print(f"Warning: No progress in path extraction for robot {self.robot_id}")
+                logger.warning(f"No progress in path extraction for robot {self.robot_id}")
                 return path  # Return partial path
 
+            if best_neighbor in visited:
+                logger.warning(f"Path extraction looped for robot {self.robot_id}")
+                return []
+
+            visited.add(best_neighbor)
             path.append(best_neighbor)
             current = best_neighbor
 
@@ -0,0 +1,110 @@
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+class IndexedHeap:
+    """
+    Binary min-heap that tracks each item's index for in-place key updates.
+
+    Unlike heapq with lazy deletion, every item appears at most once,
+    so changing a priority never leaves stale entries behind to skip.
+    Ties on key are broken by comparing the items themselves.
+    """
+
+    __slots__ = ("_heap", "_pos")
+
+    def __init__(self):
+        self._heap: List[Tuple[Any, Hashable]] = []  # (key, item) entries
+        self._pos: Dict[Hashable, int] = {}  # item -> index in _heap
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._pos
+
+    def clear(self):
+        """Remove all items"""
+        self._heap.clear()
+        self._pos.clear()
+
+    def push(self, item: Hashable, key: Any):
+        """
+        Insert item with key, or change its key if already present.
+        Covers both decrease-key and increase-key.
+        """
+        index = self._pos.get(item)
+        if index is None:
+            self._heap.append((key, item))
+            index = len(self._heap) - 1
+            self._pos[item] = index
+            self._sift_up(index)
+            return
+
+        old_key = self._heap[index][0]
+        self._heap[index] = (key, item)
+        if key < old_key:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def top(self) -> Tuple[Any, Hashable]:
+        """Return (key, item) with the smallest key without removing it"""
+        return self._heap[0]
+
+    def pop(self) -> Tuple[Any, Hashable]:
+        """Remove and return (key, item) with the smallest key"""
+        entry = self._heap[0]
+        self._remove_at(0)
+        return entry
+
+    def remove(self, item: Hashable):
+        """Remove item if present"""
+        index = self._pos.get(item)
+        if index is not None:
+            self._remove_at(index)
+
+    def _remove_at(self, index: int):
+        heap = self._heap
+        del self._pos[heap[index][1]]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self._pos[last[1]] = index
+            self._sift_up(index)
+            self._sift_down(self._pos[last[1]])
+
+    def _sift_up(self, index: int):
+        heap = self._heap
+        pos = self._pos
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if entry < heap[parent]:
+                heap[index] = heap[parent]
+                pos[heap[index][1]] = index
+                index = parent
+            else:
+                break
+        heap[index] = entry
+        pos[entry[1]] = index
+
+    def _sift_down(self, index: int):
+        heap = self._heap
+        pos = self._pos
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and heap[right] < heap[child]:
+                child = right
+            if heap[child] < entry:
+                heap[index] = heap[child]
+                pos[heap[index][1]] = index
+                index = child
+            else:
+                break
+        heap[index] = entry
+        pos[entry[1]] = index
@@ -1,6 +1,7 @@
 import numpy as np
+from collections import OrderedDict
 from enum import Enum
-from typing import Tuple, List, Optional, Set
+from typing import Tuple, List, Optional, Set, Iterable
 
 class CellType(Enum):
     """Represents the state of each cell in the grid"""
@@ -9,12 +10,33 @@ class CellType(Enum):
     ROBOT = 2
     GOAL = 3
 
+# Neighbors depend only on the grid size, so worlds of the same size share
+# one cache: (width, height) -> {(x, y): get_neighbors() result}. Only the
+# most recently used sizes are kept; an evicted cache lives on in the worlds
+# still using it, it just stops being shared with new ones
+_NEIGHBOR_CACHES = OrderedDict()
+_MAX_NEIGHBOR_CACHES = 8
+
+def _neighbor_cache(width: int, height: int) -> dict:
+    """Return the shared get_neighbors() cache for a grid size."""
+    key = (width, height)
+    cache = _NEIGHBOR_CACHES.get(key)
+    if cache is None:
+        cache = _NEIGHBOR_CACHES[key] = {}
+        if len(_NEIGHBOR_CACHES) > _MAX_NEIGHBOR_CACHES:
+            _NEIGHBOR_CACHES.popitem(last=False)
+    else:
+        _NEIGHBOR_CACHES.move_to_end(key)
+    return cache
+
 class GridWorld:
     """
     Manages the 2D grid environment for robot navigation.
     Coordinates use (x, y) where x is column and y is row.
     Origin (0, 0) is at top-left corner.
     Uses 4-connected grid (Manhattan movement only).
+    Not thread-safe for writes: concurrent readers (e.g. parallel planners)
+    are fine as long as nothing adds or removes obstacles meanwhile.
     """
 
     def __init__(self, width: int = 10, height: int = 10):
@@ -24,6 +46,7 @@ class GridWorld:
         self.grid = np.full((height, width), CellType.EMPTY.value, dtype=np.int8)
         self.static_obstacles = set()  # Permanent obstacles
         self.robot_positions = {}  # robot_id -> (x, y)
+        self._neighbors = _neighbor_cache(width, height)  # Shared per grid size
 
     def add_obstacle(self, x: int, y: int):
         """Add a static obstacle to the grid"""
@@ -31,12 +54,35 @@ class GridWorld:
             self.grid[y, x] = CellType.OBSTACLE.value
             self.static_obstacles.add((x, y))
 
+    def add_obstacles(self, cells: Iterable[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        """
+        Add many static obstacles in one batch.
+        Out-of-bounds cells are ignored, as with add_obstacle().
+        Returns the cells that were newly blocked (e.g. for changed_cells).
+        """
+        new_cells = {(x, y) for x, y in cells
+                     if self.is_valid(x, y)} - self.static_obstacles
+        if new_cells:
+            xs, ys = zip(*new_cells)
+            self.grid[list(ys), list(xs)] = CellType.OBSTACLE.value
+            self.static_obstacles.update(new_cells)
+        return new_cells
+
     def remove_obstacle(self, x: int, y: int):
         """Remove an obstacle (useful for dynamic environments)"""
         if (x, y) in self.static_obstacles:
             self.grid[y, x] = CellType.EMPTY.value
             self.static_obstacles.remove((x, y))
 
+    def reset(self):
+        """
+        Clear all obstacles and robots, keeping the current dimensions.
+        Reuses the existing grid buffer instead of allocating a new one.
+        """
+        self.grid.fill(CellType.EMPTY.value)
+        self.static_obstacles.clear()
+        self.robot_positions.clear()
+
     def is_valid(self, x: int, y: int) -> bool:
         """Check if coordinates are within grid bounds"""
         return 0 <= x < self.width and 0 <= y < self.height
@@ -47,25 +93,35 @@ class GridWorld:
         Only checks static obstacles, NOT robots.
         This allows robots to plan paths that may collide.
         """
-        if not self.is_valid(x, y):
-            return False
-
-        # Check static obstacles only
-        if (x, y) in self.static_obstacles:
-            return False
-
+        # Check bounds and static obstacles only (inlined - this is the
+        # planner's hottest call)
         # Don't check robot positions - they're not obstacles for planning
         # This allows collision detection to catch when paths overlap
+        return (0 <= x < self.width and 0 <= y < self.height
+                and (x, y) not in self.static_obstacles)
 
-        return True
+    def is_path_free(self, path: List[Tuple[int, int]]) -> bool:
+        """
+        Check that every cell of a path is in bounds and obstacle-free.
+        Does a single set-disjointness check instead of is_free() per cell.
+        """
+        width, height = self.width, self.height
+        for x, y in path:
+            if not (0 <= x < width and 0 <= y < height):
+                return False
+        return self.static_obstacles.isdisjoint(path)
 
-    def get_neighbors(self, x: int, y: int) -> List[Tuple[int, int, float]]:
+    def get_neighbors(self, x: int, y: int) -> Tuple[Tuple[int, int, float], ...]:
         """
         Get all valid neighbors and their movement costs.
-        Returns list of (nx, ny, cost) tuples.
+        Returns tuple of (nx, ny, cost) tuples.
         Using 4-connected grid (Manhattan movement only, no diagonals).
+        Neighbors depend only on the grid size, so each cell's tuple is
+        built once and shared by every world of the same size.
         """
-        neighbors = []
+        neighbors = self._neighbors.get((x, y))
+        if neighbors is not None:
+            return neighbors
 
         # Define only 4 cardinal directions with cost = 1
         directions = [
@@ -76,11 +132,11 @@ class GridWorld:
             # NO DIAGONAL MOVEMENTS
         ]
 
-        for (dx, dy), cost in directions:
-            nx, ny = x + dx, y + dy
-            if self.is_valid(nx, ny):
-                neighbors.append((nx, ny, cost))
-
+        neighbors = tuple(
+            (x + dx, y + dy, cost) for (dx, dy), cost in directions
+            if self.is_valid(x + dx, y + dy)
+        )
+        self._neighbors[(x, y)] = neighbors
         return neighbors
 
     def resize(self, new_width: int, new_height: int):
@@ -115,6 +171,7 @@ class GridWorld:
         # Update world properties
         self.width = new_width
         self.height = new_height
+        self._neighbors = _neighbor_cache(new_width, new_height)
         self.grid = new_grid
         self.static_obstacles = new_obstacles
         self.robot_positions = new_robot_positions
\ No newline at end of file
@@ -6,7 +6,13 @@ Provides distinct colors for robots, goals, and paths.
 
 import colorsys
 import math
-from typing import Tuple, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Tuple, Dict, Mapping, Optional
+
+# Minimum color distance for good contrast (compared squared, no sqrt)
+MIN_CONTRAST_DISTANCE = 100
+MIN_CONTRAST_DISTANCE_SQ = MIN_CONTRAST_DISTANCE * MIN_CONTRAST_DISTANCE
 
 # Predefined colors for first two robots
 PREDEFINED_COLORS = {
@@ -14,16 +20,35 @@ PREDEFINED_COLORS = {
     "robot2": (200, 50, 0),      # Red
 }
 
-# Cache for generated colors
-_color_cache: Dict[str, Tuple[int, int, int]] = {}
+def get_robot_colors(count: int = 0) -> Dict[str, Tuple[int, int, int]]:
+    """
+    Get robot colors in bulk.
+
+    Args:
+        count: Number of robots (robot1..robotN) to include.
+               0 returns only the predefined colors.
+
+    Returns:
+        Dictionary of robot IDs to RGB colors
+    """
+    if count <= 0:
+        return PREDEFINED_COLORS.copy()
+    return {f"robot{i}": generate_robot_color(f"robot{i}") for i in range(1, count + 1)}
 
 
-def get_robot_colors() -> Dict[str, Tuple[int, int, int]]:
+def _parse_robot_num(robot_id: str) -> Optional[int]:
     """
-    Get predefined robot colors.
-    Returns dictionary of robot IDs to RGB colors.
+    Extract the number from a "robotN" ID.
+    Returns None if the ID is not of that form.
     """
-    return PREDEFINED_COLORS.copy()
+    if robot_id.startswith("robot"):
+        # int() also accepts signs and surrounding whitespace ("robot-5",
+        # "robot 5"), which these IDs have always been parsed with
+        try:
+            return int(robot_id[5:])
+        except ValueError:
+            pass
+    return None
 
 
 def hsv_to_rgb(h: float, s: float, v: float) -> Tuple[int, int, int]:
@@ -48,9 +73,11 @@ def hsv_to_rgb(h: float, s: float, v: float) -> Tuple[int, int, int]:
     return (int(r * 255), int(g * 255), int(b * 255))
 
 
+@lru_cache(maxsize=1024)
 def generate_robot_color(robot_id: str) -> Tuple[int, int, int]:
     """
     Generate a unique color for a robot.
+    Results are memoized per robot_id; see clear_color_cache().
 
     Args:
         robot_id: Robot identifier (e.g., "robot3")
@@ -62,17 +89,9 @@ def generate_robot_color(robot_id: str) -> Tuple[int, int, int]:
     if robot_id in PREDEFINED_COLORS:
         return PREDEFINED_COLORS[robot_id]
 
-    # Check cache
-    if robot_id in _color_cache:
-        return _color_cache[robot_id]
-
     # Extract robot number
-    try:
-        if robot_id.startswith("robot"):
-            robot_num = int(robot_id[5:])
-        else:
-            robot_num = hash(robot_id) % 100
-    except (ValueError, IndexError):
+    robot_num = _parse_robot_num(robot_id)
+    if robot_num is None:
         robot_num = hash(robot_id) % 100
 
     # Generate color using HSV
@@ -92,12 +111,25 @@ def generate_robot_color(robot_id: str) -> Tuple[int, int, int]:
     saturation = 0.8
     value = 0.9
 
-    color = hsv_to_rgb(hue, saturation, value)
+    return hsv_to_rgb(hue, saturation, value)
 
-    # Cache the result
-    _color_cache[robot_id] = color
 
-    return color
+def color_distance_sq(color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -> int:
+    """
+    Calculate squared Euclidean distance between two colors.
+    Use for threshold comparisons to avoid the sqrt.
+
+    Args:
+        color1: First RGB color
+        color2: Second RGB color
+
+    Returns:
+        Squared distance value
+    """
+    dr = color2[0] - color1[0]
+    dg = color2[1] - color1[1]
+    db = color2[2] - color1[2]
+    return dr * dr + dg * dg + db * db
 
 
 def color_distance(color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -> float:
@@ -111,10 +143,7 @@ def color_distance(color1: Tuple[int, int, int], color2: Tuple[int, int, int]) -
     Returns:
         Distance value
     """
-    r1, g1, b1 = color1
-    r2, g2, b2 = color2
-
-    return math.sqrt((r2 - r1) ** 2 + (g2 - g1) ** 2 + (b2 - b1) ** 2)
+    return math.sqrt(color_distance_sq(color1, color2))
 
 
 def ensure_color_contrast(color: Tuple[int, int, int],
@@ -129,24 +158,20 @@ def ensure_color_contrast(color: Tuple[int, int, int],
     Returns:
         True if contrast is sufficient
     """
-    # Calculate distance
-    dist = color_distance(color, background)
-
-    # Minimum distance for good contrast
-    MIN_DISTANCE = 100
-
-    return dist >= MIN_DISTANCE
+    return color_distance_sq(color, background) >= MIN_CONTRAST_DISTANCE_SQ
 
 
-def get_color_set(robot_id: str) -> Dict[str, Tuple[int, int, int]]:
+@lru_cache(maxsize=1024)
+def get_color_set(robot_id: str) -> Mapping[str, Tuple[int, int, int]]:
     """
     Get a complete color set for a robot (robot, goal, path colors).
+    Memoized per robot_id; the shared result is a read-only mapping.
 
     Args:
         robot_id: Robot identifier
 
     Returns:
-        Dictionary with 'robot', 'goal', and 'path' colors
+        Read-only mapping with 'robot', 'goal', and 'path' colors
     """
     # Get base robot color
     robot_color = generate_robot_color(robot_id)
@@ -171,11 +196,11 @@ def get_color_set(robot_id: str) -> Dict[str, Tuple[int, int, int]]:
     path_v = min(1.0, v * 1.3)
     path_color = tuple(int(c * 255) for c in colorsys.hsv_to_rgb(path_h, path_s, path_v))
 
-    return {
+    return MappingProxyType({
         "robot": robot_color,
         "goal": goal_color,
         "path": path_color
-    }
+    })
 
 
 def get_hue_for_robot(robot_id: str, total_robots: int = 10) -> float:
@@ -189,12 +214,8 @@ def get_hue_for_robot(robot_id: str, total_robots: int = 10) -> float:
     Returns:
         Hue value (0-360)
     """
-    try:
-        if robot_id.startswith("robot"):
-            robot_num = int(robot_id[5:])
-        else:
-            robot_num = 3
-    except (ValueError, IndexError):
+    robot_num = _parse_robot_num(robot_id)
+    if robot_num is None:
         robot_num = 3
 
     # For first two robots, return fixed hues
@@ -214,4 +235,5 @@ def clear_color_cache():
     Clear the color cache.
     Useful for testing or resetting colors.
     """
-    _color_cache.clear()
\ No newline at end of file
+    generate_robot_color.cache_clear()
+    get_color_set.cache_clear()
@@ -24,20 +24,28 @@ class GameManager:
 
     def get_state(self) -> Dict[str, Any]:
         """Get current game state as JSON-serializable dict."""
+        coordinator = self.coordinator
+
         # Always detect stuck robots, even when paused
-        self.coordinator.detect_stuck_robots()
+        coordinator.detect_stuck_robots()
 
         # Get robots in the correct format for frontend
+        # Bind the coordinator's per-robot maps once instead of per robot
+        goals = coordinator.goals
+        paths = coordinator.paths
+        stuck = coordinator.stuck_robots
+        blocked = coordinator.collision_blocked_robots
+        goal_blocked = coordinator.goal_blocked_robots
         robots = {}
-        for robot_id, pos in self.coordinator.current_positions.items():
+        for robot_id, pos in coordinator.current_positions.items():
             robots[robot_id] = {
                 "id": robot_id,
                 "position": list(pos),
-                "goal": list(self.coordinator.goals[robot_id]),
-                "path": self.coordinator.paths.get(robot_id, []),
-                "is_stuck": robot_id in self.coordinator.stuck_robots,
-                "is_paused": robot_id in self.coordinator.collision_blocked_robots,
-                "is_goal_blocked": robot_id in self.coordinator.goal_blocked_robots
+                "goal": list(goals[robot_id]),
+                "path": paths.get(robot_id, []),
+                "is_stuck": robot_id in stuck,
+                "is_paused": robot_id in blocked,
+                "is_goal_blocked": robot_id in goal_blocked
             }
 
         return {
@@ -136,19 +144,18 @@ class GameManager:
         if not self.robot_id_pool:
             return None  # No available robot IDs (max 10 robots)
 
-        # Get next available robot ID from pool
-        robot_num = self.robot_id_pool.pop()
-        robot_id = f"robot{robot_num}"
+        # Peek at the next available robot ID; it is only taken from the
+        # pool once the coordinator accepts the robot
+        robot_id = f"robot{self.robot_id_pool[-1]}"
 
-        success = self.coordinator.add_robot(robot_id, start=start, goal=goal)
-        if success:
-            self.coordinator.recompute_paths()
-            return robot_id
-        else:
-            # Return ID to pool if add failed
-            self.robot_id_pool.append(robot_num)
+        # add_robot plans the new robot's path; the other robots' paths
+        # don't depend on it, so no full replan is needed
+        if not self.coordinator.add_robot(robot_id, start=start, goal=goal):
             return None
 
+        self.robot_id_pool.pop()
+        return robot_id
+
     def pause(self):
         """Pause simulation."""
         self.paused = True
@@ -177,13 +184,16 @@ class GameManager:
                 self.robot_id_pool.append(robot_num)
             except ValueError:
                 pass  # Invalid robot ID format, ignore
-            self.coordinator.recompute_paths()
+            # coordinator.remove_robot() already replanned the remaining robots
         return success
 
     def clear_obstacles(self):
         """Clear all obstacles from the arena."""
-        self.world.static_obstacles.clear()
-        self.coordinator.recompute_paths()
+        cleared = set(self.world.static_obstacles)
+        for x, y in cleared:
+            self.world.remove_obstacle(x, y)
+        # Pass the freed cells so D* Lite planners pick up the shorter routes
+        self.coordinator.recompute_paths(changed_cells=cleared)
         return self.get_state()
 
     def reset(self):
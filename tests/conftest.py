@@ -0,0 +1,30 @@
+"""
+Shared pytest fixtures.
+"""
+import pytest
+from multi_robot_playground.core.world import GridWorld
+from multi_robot_playground.core.coordinator import MultiAgentCoordinator
+
+
+@pytest.fixture(scope="module")
+def shared_coordinator():
+    """One 10x10 world and coordinator shared by every test in a module."""
+    return MultiAgentCoordinator(GridWorld(10, 10))
+
+
+@pytest.fixture
+def coordinator(shared_coordinator):
+    """Shared coordinator, reset to a clean 10x10 slate before each test."""
+    shared_coordinator.reset()
+    # reset() keeps the size and settings, which an earlier test may have changed
+    world = shared_coordinator.world
+    if (world.width, world.height) != (10, 10):
+        world.resize(10, 10)
+    shared_coordinator.parallel_planning = False
+    return shared_coordinator
+
+
+@pytest.fixture
+def world(coordinator):
+    """The shared coordinator's world."""
+    return coordinator.world
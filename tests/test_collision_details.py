@@ -5,18 +5,13 @@ Ensures collision pairs and positions are correctly preserved.
 """
 
 import pytest
-from multi_robot_playground.core.world import GridWorld
-from multi_robot_playground.core.coordinator import MultiAgentCoordinator
 
 
 class TestCollisionDetailTracking:
     """Test that collision details are accurately tracked."""
 
-    def test_collision_details_stored(self):
+    def test_collision_details_stored(self, coordinator):
         """Test that collision details are stored with pairs and positions."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Set up multiple same-cell collisions at different positions
         # Collision 1: robotA and robotB both trying to enter (5,3)
         coordinator.add_robot("robotA", start=(4, 3), goal=(6, 3))
@@ -52,11 +47,8 @@ class TestCollisionDetailTracking:
 
         print("✓ Collision details correctly track pairs and positions")
 
-    def test_multiple_robots_same_cell(self):
+    def test_multiple_robots_same_cell(self, coordinator):
         """Test 3+ robots trying to enter the same cell."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Three robots all trying to enter (5,5)
         coordinator.add_robot("robot1", start=(4, 5), goal=(6, 5))
         coordinator.add_robot("robot2", start=(5, 4), goal=(5, 6))
@@ -86,11 +78,8 @@ class TestCollisionDetailTracking:
 
         print("✓ Multiple robots at same cell tracked correctly")
 
-    def test_swap_collision_details(self):
+    def test_swap_collision_details(self, coordinator):
         """Test swap collision details are tracked."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Two robots swapping positions
         coordinator.add_robot("robotX", start=(3, 3), goal=(4, 3))
         coordinator.add_robot("robotY", start=(4, 3), goal=(3, 3))
@@ -108,11 +97,29 @@ class TestCollisionDetailTracking:
 
         print("✓ Swap collision details tracked correctly")
 
-    def test_blocked_robot_details(self):
-        """Test blocked robot collision details - same as test_single_blocked_robot_collision."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
+    def test_collision_blocked_robots_view(self, coordinator):
+        """Test blocked robot accessors reflect the current collision state."""
+        coordinator.add_robot("robotX", start=(3, 3), goal=(4, 3))
+        coordinator.add_robot("robotY", start=(4, 3), goal=(3, 3))
 
+        coordinator.step_simulation()
+
+        blocked = coordinator.get_collision_blocked_robots()
+        assert len(blocked) == 2
+        assert "robotX" in blocked
+        assert set(blocked) == {"robotX", "robotY"}
+        assert coordinator.is_robot_blocked("robotY")
+        assert coordinator.get_block_reason("robotY") == "swap_collision"
+
+        # Live view - reflects unblocking without another call
+        coordinator.unblock_robot("robotX")
+        assert "robotX" not in blocked
+        assert len(blocked) == 1
+
+        print("✓ Blocked robot accessors work correctly")
+
+    def test_blocked_robot_details(self, coordinator):
+        """Test blocked robot collision details - same as test_single_blocked_robot_collision."""
         # A and B will swap (get blocked)
         coordinator.add_robot("robotA", start=(3, 3), goal=(4, 3))
         coordinator.add_robot("robotB", start=(4, 3), goal=(3, 3))
@@ -138,11 +145,8 @@ class TestCollisionDetailTracking:
 
         print("✓ Collision details tracked correctly (swap + same_cell)")
 
-    def test_cascade_blocked_details(self):
+    def test_cascade_blocked_details(self, coordinator):
         """Test cascade of blocked robots - same as test_cascade_chain."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # A and B will collide (swap)
         coordinator.add_robot("robotA", start=(5, 5), goal=(6, 5))
         coordinator.add_robot("robotB", start=(6, 5), goal=(5, 5))
@@ -184,10 +188,4 @@ class TestCollisionDetailTracking:
 
 
 if __name__ == "__main__":
-    test = TestCollisionDetailTracking()
-    test.test_collision_details_stored()
-    test.test_multiple_robots_same_cell()
-    test.test_swap_collision_details()
-    test.test_blocked_robot_details()
-    test.test_cascade_blocked_details()
-    print("\nAll collision detail tests passed!")
\ No newline at end of file
+    pytest.main([__file__, "-v"])
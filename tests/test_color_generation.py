@@ -25,6 +25,14 @@ class TestColorGeneration:
         assert colors["robot1"] == (0, 100, 200)  # Blue
         assert colors["robot2"] == (200, 50, 0)   # Red
 
+    def test_get_robot_colors_bulk(self):
+        """Bulk lookup should match per-robot generation"""
+        colors = get_robot_colors(10)
+
+        assert list(colors) == [f"robot{i}" for i in range(1, 11)]
+        for robot_id, color in colors.items():
+            assert color == generate_robot_color(robot_id)
+
     def test_generate_unique_colors(self):
         """Should generate unique colors for multiple robots"""
         color_gen = get_robot_colors()
@@ -104,6 +112,18 @@ class TestColorContrast:
         dist = color_distance((255, 0, 0), (0, 255, 0))
         assert dist > 300
 
+    def test_color_distance_sq(self):
+        """Squared distance should match color_distance squared"""
+        from multi_robot_playground.utils.colors import color_distance, color_distance_sq
+
+        assert color_distance_sq((0, 0, 0), (255, 255, 255)) == 3 * 255 * 255
+        assert color_distance_sq((10, 20, 30), (13, 24, 30)) == 25
+        assert color_distance((10, 20, 30), (13, 24, 30)) == 5
+
+        # Contrast threshold is inclusive on either side of the square
+        assert ensure_color_contrast((100, 0, 0), (0, 0, 0))
+        assert not ensure_color_contrast((99, 0, 0), (0, 0, 0))
+
     def test_avoid_similar_colors(self):
         """Should avoid generating similar colors"""
         generated = []
@@ -165,6 +185,11 @@ class TestColorSets:
         assert colors1["goal"] == colors2["goal"]
         assert colors1["path"] == colors2["path"]
 
+        # Cached - same read-only object is returned
+        assert colors1 is colors2
+        with pytest.raises(TypeError):
+            colors1["robot"] = (0, 0, 0)
+
 
 class TestDynamicColorGeneration:
     """Tests for dynamic color generation based on robot count"""
@@ -217,9 +242,7 @@ class TestColorPersistence:
         """Colors should be cached for performance"""
         from multi_robot_playground.utils.colors import generate_robot_color, clear_color_cache
 
-        # Clear cache if it exists
-        if hasattr(generate_robot_color, 'clear_cache'):
-            clear_color_cache()
+        clear_color_cache()
 
         # Generate color
         color1 = generate_robot_color("robot10")
@@ -276,6 +299,13 @@ class TestEdgeCases:
             # Acceptable to reject robot0
             pass
 
+    def test_signed_and_padded_robot_numbers(self):
+        """Signed or space-padded IDs ("robot-5", "robot 5") still parse as numbers"""
+        from multi_robot_playground.utils.colors import get_hue_for_robot
+
+        assert generate_robot_color("robot 5") == generate_robot_color("robot5")
+        assert get_hue_for_robot("robot-5") != get_hue_for_robot("robotX")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -1,59 +1,78 @@
 #!/usr/bin/env python3
 """
 Test the grid export feature.
+Exported grids must re-import to the same world and robots.
 """
 
+import pytest
 from multi_robot_playground.core.world import GridWorld
 from multi_robot_playground.core.coordinator import MultiAgentCoordinator
 from multi_robot_playground.utils.export_grid import export_to_visual_format
 from multi_robot_playground.utils.parse_test_grid import setup_from_visual
 
-# Create a test scenario
-world = GridWorld(5, 5)
-world.add_obstacle(2, 2)
-world.add_obstacle(3, 1)
-
-coordinator = MultiAgentCoordinator(world)
-coordinator.add_robot("robot1", start=(0, 0), goal=(4, 4))
-coordinator.add_robot("robot2", start=(4, 0), goal=(0, 4))
-
-# Export to visual format
-exported = export_to_visual_format(world, coordinator)
-print("Exported grid:")
-print(exported)
-print("\n" + "="*50)
-
-# Now parse it back and verify it matches
-print("Re-importing the exported grid...")
-lines = exported.split('\n')
-grid_lines = []
-for line in lines:
-    # Skip comments and test name
-    if line.startswith('#') or line.startswith('TEST_'):
-        continue
-    # Keep size line and grid lines
-    if line.strip():
-        grid_lines.append(line)
-
-grid_text = '\n'.join(grid_lines[:6])  # Size + 5 grid rows
-print(f"Grid text:\n{grid_text}\n")
-
-world2, coordinator2 = setup_from_visual(grid_text)
-
-# Verify obstacles match
-print("Verification:")
-print(f"Original obstacles: {sorted(world.static_obstacles)}")
-print(f"Imported obstacles: {sorted(world2.static_obstacles)}")
-print(f"Obstacles match: {world.static_obstacles == world2.static_obstacles}")
-
-# Verify robot positions
-print(f"\nOriginal robots: {coordinator.current_positions}")
-print(f"Imported robots: {coordinator2.current_positions}")
-print(f"Robots match: {coordinator.current_positions == coordinator2.current_positions}")
-
-# Verify goals
-print(f"\nOriginal goals: {coordinator.goals}")
-print(f"Imported goals: {coordinator2.goals}")
-print(f"Goals match: {coordinator.goals == coordinator2.goals}")
-
-print("\n✓ Export/import round-trip works!")
\ No newline at end of file
+
+# (width, height, obstacles, robot_id -> (start, goal))
+SCENARIOS = [
+    pytest.param(5, 5, [(2, 2), (3, 1)],
+                 {"robot1": ((0, 0), (4, 4)), "robot2": ((4, 0), (0, 4))},
+                 id="5x5_two_robots"),
+    pytest.param(7, 4, [(1, 1), (5, 2), (6, 0)],
+                 {"robot1": ((0, 3), (6, 3))},
+                 id="7x4_one_robot"),
+    pytest.param(3, 3, [],
+                 {"robot1": ((0, 0), (2, 2)), "robot2": ((2, 0), (0, 2))},
+                 id="3x3_no_obstacles"),
+]
+
+
+def build_scenario(width, height, obstacles, robots):
+    """Create a world and coordinator for one scenario."""
+    world = GridWorld(width, height)
+    for x, y in obstacles:
+        world.add_obstacle(x, y)
+
+    coordinator = MultiAgentCoordinator(world)
+    for robot_id, (start, goal) in robots.items():
+        coordinator.add_robot(robot_id, start=start, goal=goal)
+
+    return world, coordinator
+
+
+def grid_text_from_export(exported):
+    """Keep only the size line and grid rows of an exported grid."""
+    return '\n'.join(
+        line for line in exported.split('\n')
+        if line.strip() and not line.startswith('#') and not line.startswith('TEST_')
+    )
+
+
+class TestExportRoundTrip:
+    """Export to visual format and parse it back"""
+
+    @pytest.mark.parametrize("width,height,obstacles,robots", SCENARIOS)
+    def test_export_roundtrip(self, width, height, obstacles, robots):
+        """Re-imported grid should match the original"""
+        world, coordinator = build_scenario(width, height, obstacles, robots)
+
+        exported = export_to_visual_format(world, coordinator)
+        world2, coordinator2 = setup_from_visual(grid_text_from_export(exported))
+
+        assert (world2.width, world2.height) == (width, height)
+        assert world2.static_obstacles == world.static_obstacles
+        assert coordinator2.current_positions == coordinator.current_positions
+        assert coordinator2.goals == coordinator.goals
+
+    def test_export_header_and_robot_comments(self):
+        """Export should include the test header, size and robot summary"""
+        world, coordinator = build_scenario(5, 5, [(2, 2)],
+                                            {"robot1": ((0, 0), (4, 4))})
+
+        lines = export_to_visual_format(world, coordinator).split('\n')
+
+        assert lines[1] == "TEST_EXPORTED"
+        assert lines[2] == "5x5"
+        assert "# robot1: (0, 0) -> (4, 4)" in lines
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
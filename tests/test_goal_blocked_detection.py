@@ -2,18 +2,13 @@
 Tests for goal-blocked robot detection.
 """
 import pytest
-from multi_robot_playground.core.world import GridWorld
-from multi_robot_playground.core.coordinator import MultiAgentCoordinator
 
 
 class TestGoalBlockedDetection:
     """Test detection of robots with goals blocked by obstacles."""
 
-    def test_goal_blocked_robot_detection(self):
+    def test_goal_blocked_robot_detection(self, world, coordinator):
         """Test that robots with obstacles on their goals are detected as goal-blocked."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add robot with goal at (5, 5)
         coordinator.add_robot("robot1", start=(0, 0), goal=(5, 5))
 
@@ -30,11 +25,8 @@ class TestGoalBlockedDetection:
         assert "robot1" in coordinator.goal_blocked_robots
         assert "robot1" in coordinator.stuck_robots  # Also in stuck for compatibility
 
-    def test_goal_blocked_cleared_when_obstacle_removed(self):
+    def test_goal_blocked_cleared_when_obstacle_removed(self, world, coordinator):
         """Test that goal-blocked status is cleared when obstacle is removed."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add robot and obstacle on goal
         coordinator.add_robot("robot1", start=(0, 0), goal=(5, 5))
         world.add_obstacle(5, 5)
@@ -53,11 +45,8 @@ class TestGoalBlockedDetection:
         assert "robot1" not in coordinator.goal_blocked_robots
         assert "robot1" not in coordinator.stuck_robots
 
-    def test_multiple_goal_blocked_robots(self):
+    def test_multiple_goal_blocked_robots(self, world, coordinator):
         """Test multiple robots can be goal-blocked simultaneously."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add multiple robots with different goals
         coordinator.add_robot("robot1", start=(0, 0), goal=(5, 5))
         coordinator.add_robot("robot2", start=(9, 9), goal=(7, 7))
@@ -74,11 +63,8 @@ class TestGoalBlockedDetection:
         assert "robot2" in coordinator.goal_blocked_robots
         assert "robot3" not in coordinator.goal_blocked_robots
 
-    def test_goal_blocked_vs_stuck_distinction(self):
+    def test_goal_blocked_vs_stuck_distinction(self, world, coordinator):
         """Test distinction between goal-blocked and stuck (no path) robots."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Robot1: goal blocked by obstacle on goal
         coordinator.add_robot("robot1", start=(0, 0), goal=(5, 5))
         world.add_obstacle(5, 5)
@@ -86,10 +72,8 @@ class TestGoalBlockedDetection:
         # Robot2: stuck because goal is unreachable (surrounded by obstacles)
         coordinator.add_robot("robot2", start=(9, 0), goal=(9, 9))
         # Surround goal but don't place obstacle on it
-        for x in range(8, 10):
-            for y in range(8, 10):
-                if (x, y) != (9, 9):
-                    world.add_obstacle(x, y)
+        world.add_obstacles([(x, y) for x in range(8, 10) for y in range(8, 10)
+                             if (x, y) != (9, 9)])
 
         coordinator.recompute_paths()
         coordinator.detect_stuck_robots()
@@ -102,11 +86,8 @@ class TestGoalBlockedDetection:
         assert "robot2" not in coordinator.goal_blocked_robots
         assert "robot2" in coordinator.stuck_robots
 
-    def test_robot_at_goal_not_goal_blocked(self):
+    def test_robot_at_goal_not_goal_blocked(self, world, coordinator):
         """Test that robot at its goal is not marked as goal-blocked even if obstacle placed."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add robot at its goal
         coordinator.add_robot("robot1", start=(5, 5), goal=(5, 5))
 
@@ -9,18 +9,20 @@ Test goal placement rules:
 """
 
 import pytest
-from multi_robot_playground.core.world import GridWorld
-from multi_robot_playground.core.coordinator import MultiAgentCoordinator
+
+
+# Free cells used by test_goal_on_free_space
+FREE_POSITIONS = [(3, 3), (8, 1), (4, 7), (1, 8), (6, 2)]
+
+# Obstacles used by the complex robot-position scenario
+SCENARIO_OBSTACLES = [(3, 3), (3, 4), (4, 3), (7, 7), (8, 8)]
 
 
 class TestGoalPlacementRules:
     """Test that goal placement follows the correct rules."""
 
-    def test_goal_on_self(self):
+    def test_goal_on_self(self, coordinator):
         """Test that a robot can place its goal on its own position."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add a robot at (5, 5)
         coordinator.add_robot("robot1", start=(5, 5), goal=(9, 9))
 
@@ -31,11 +33,8 @@ class TestGoalPlacementRules:
 
         print("✓ Robot can place goal on itself")
 
-    def test_goal_on_other_robot_position(self):
+    def test_goal_on_other_robot_position(self, coordinator):
         """Test that a robot can place its goal on another robot's current position."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add two robots
         coordinator.add_robot("robot1", start=(3, 3), goal=(9, 9))
         coordinator.add_robot("robot2", start=(7, 7), goal=(0, 0))
@@ -52,11 +51,8 @@ class TestGoalPlacementRules:
 
         print("✓ Robot can place goal on another robot's position but not their goal")
 
-    def test_multiple_robots_cannot_share_goal(self):
+    def test_multiple_robots_cannot_share_goal(self, coordinator):
         """Test that multiple robots cannot have the same goal position."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add three robots
         coordinator.add_robot("robot1", start=(0, 0), goal=(5, 5))
         coordinator.add_robot("robot2", start=(9, 9), goal=(3, 3))
@@ -80,11 +76,8 @@ class TestGoalPlacementRules:
 
         print("✓ Multiple robots cannot share the same goal")
 
-    def test_goal_on_obstacle_fails(self):
+    def test_goal_on_obstacle_fails(self, world, coordinator):
         """Test that goals cannot be placed on obstacles."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add a robot
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
 
@@ -98,43 +91,56 @@ class TestGoalPlacementRules:
 
         print("✓ Goals cannot be placed on obstacles")
 
-    def test_goal_on_free_space(self):
-        """Test that goals can be placed on any free space."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
+    def test_goal_freed_after_removal_or_change(self, coordinator):
+        """Test that a goal becomes available once its robot leaves or moves it."""
+        coordinator.add_robot("robot1", start=(0, 0), goal=(5, 5))
+        coordinator.add_robot("robot2", start=(9, 9), goal=(3, 3))
+        coordinator.add_robot("robot3", start=(0, 9), goal=(7, 7))
+
+        # robot2 moves its goal away, freeing (3, 3)
+        assert coordinator.set_new_goal("robot2", (2, 2))
+        assert coordinator.set_new_goal("robot1", (3, 3)), "Old goal should be free again"
+
+        # Removing robot3 frees (7, 7)
+        coordinator.remove_robot("robot3")
+        assert coordinator.set_new_goal("robot2", (7, 7)), "Removed robot's goal should be free"
+        assert not coordinator.set_new_goal("robot2", (3, 3)), "robot1 still has this goal"
 
+    def test_goal_change_replans_only_that_robot(self, coordinator):
+        """Test that a goal change leaves the other robots' paths alone."""
+        coordinator.add_robot("robot1", start=(0, 0), goal=(9, 0))
+        coordinator.add_robot("robot2", start=(0, 9), goal=(9, 9))
+        path2 = coordinator.paths["robot2"]
+
+        assert coordinator.set_new_goal("robot1", (0, 5))
+        assert coordinator.paths["robot1"][-1] == (0, 5)
+        assert coordinator.paths["robot2"] is path2
+
+    @pytest.mark.parametrize("pos", FREE_POSITIONS)
+    def test_goal_on_free_space(self, world, coordinator, pos):
+        """Test that goals can be placed on any free space."""
         # Add robots and obstacles
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
         coordinator.add_robot("robot2", start=(2, 2), goal=(7, 7))
         world.static_obstacles.add((5, 5))
         world.static_obstacles.add((5, 6))
 
-        # Test various free spaces
-        free_positions = [(3, 3), (8, 1), (4, 7), (1, 8), (6, 2)]
+        # Make sure this position isn't another robot's goal
+        taken = set(coordinator.goals.values())
+        if pos not in taken:
+            success = coordinator.set_new_goal("robot1", pos)
+            assert success, f"Robot should be able to place goal on free space {pos}"
+            assert coordinator.goals["robot1"] == pos, f"Goal should be set to {pos}"
 
-        for pos in free_positions:
-            # Make sure this position isn't another robot's goal
-            if pos not in [coordinator.goals[rid] for rid in coordinator.goals]:
-                success = coordinator.set_new_goal("robot1", pos)
-                assert success, f"Robot should be able to place goal on free space {pos}"
-                assert coordinator.goals["robot1"] == pos, f"Goal should be set to {pos}"
-
-        print("✓ Goals can be placed on any free space")
-
-    def test_goal_placement_with_robot_positions(self):
+    def test_goal_placement_with_robot_positions(self, world, coordinator):
         """Test complex scenarios with robots at various positions."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Set up a scenario with robots
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
         coordinator.add_robot("robot2", start=(5, 5), goal=(0, 9))
         coordinator.add_robot("robot3", start=(9, 0), goal=(5, 0))
 
         # Add some obstacles
-        obstacles = [(3, 3), (3, 4), (4, 3), (7, 7), (8, 8)]
-        for obs in obstacles:
-            world.static_obstacles.add(obs)
+        world.static_obstacles.update(SCENARIO_OBSTACLES)
 
         # Robot1 can set goal to robot2's current position (5, 5)
         assert coordinator.set_new_goal("robot1", (5, 5)), "Should place goal on robot2's position"
@@ -150,19 +156,19 @@ class TestGoalPlacementRules:
         assert not coordinator.set_new_goal("robot2", (0, 0)), "Cannot use robot3's goal"
         assert not coordinator.set_new_goal("robot3", (5, 5)), "Cannot use robot1's goal"
 
-        # And no robot can set goal on obstacles
-        for obs in obstacles:
-            assert not coordinator.set_new_goal("robot1", obs), f"Should not place goal on obstacle {obs}"
-
         print("✓ Complex goal placement scenarios work correctly")
 
+    @pytest.mark.parametrize("obs", SCENARIO_OBSTACLES)
+    def test_goal_placement_rejects_scenario_obstacles(self, world, coordinator, obs):
+        """No robot can set its goal on an obstacle in the complex scenario."""
+        coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
+        coordinator.add_robot("robot2", start=(5, 5), goal=(0, 9))
+        coordinator.add_robot("robot3", start=(9, 0), goal=(5, 0))
+        world.static_obstacles.update(SCENARIO_OBSTACLES)
+
+        assert not coordinator.set_new_goal("robot1", obs), f"Should not place goal on obstacle {obs}"
+        assert coordinator.goals["robot1"] == (9, 9)
+
 
 if __name__ == "__main__":
-    test = TestGoalPlacementRules()
-    test.test_goal_on_self()
-    test.test_goal_on_other_robot_position()
-    test.test_multiple_robots_cannot_share_goal()
-    test.test_goal_on_obstacle_fails()
-    test.test_goal_on_free_space()
-    test.test_goal_placement_with_robot_positions()
-    print("\nAll goal placement tests passed!")
\ No newline at end of file
+    pytest.main([__file__, "-v"])
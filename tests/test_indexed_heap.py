@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test the indexed min-heap used as the D* Lite open list.
+"""
+
+import random
+import pytest
+from multi_robot_playground.core.path_planners.indexed_heap import IndexedHeap
+
+
+class TestIndexedHeap:
+    """Test push/pop ordering and in-place key updates."""
+
+    def test_pop_returns_items_in_key_order(self):
+        """Items should come out smallest key first."""
+        heap = IndexedHeap()
+        for item, key in [("c", (3, 0)), ("a", (1, 0)), ("b", (2, 0))]:
+            heap.push(item, key)
+
+        assert [heap.pop()[1] for _ in range(3)] == ["a", "b", "c"]
+        assert len(heap) == 0
+
+    def test_push_existing_item_updates_key(self):
+        """Pushing an item again should re-key it, not duplicate it."""
+        heap = IndexedHeap()
+        heap.push((0, 0), (5, 5))
+        heap.push((1, 1), (3, 3))
+
+        # Decrease key
+        heap.push((0, 0), (1, 1))
+        assert len(heap) == 2
+        assert heap.top() == ((1, 1), (0, 0))
+
+        # Increase key
+        heap.push((0, 0), (9, 9))
+        assert heap.top() == ((3, 3), (1, 1))
+
+    def test_remove(self):
+        """Removed items should no longer be contained or popped."""
+        heap = IndexedHeap()
+        for i in range(5):
+            heap.push(i, (i, i))
+
+        heap.remove(2)
+        heap.remove(42)  # Missing items are ignored
+
+        assert 2 not in heap
+        assert 3 in heap
+        assert [heap.pop()[1] for _ in range(len(heap))] == [0, 1, 3, 4]
+
+    def test_matches_sorted_order_under_random_updates(self):
+        """Random pushes, re-keys and removals should keep heap order."""
+        rng = random.Random(0)
+        heap = IndexedHeap()
+        expected = {}
+
+        for _ in range(500):
+            item = rng.randrange(50)
+            if rng.random() < 0.2:
+                heap.remove(item)
+                expected.pop(item, None)
+            else:
+                key = (rng.randrange(100), rng.randrange(100))
+                heap.push(item, key)
+                expected[item] = key
+
+        popped = [heap.pop() for _ in range(len(heap))]
+        assert popped == sorted((key, item) for item, key in expected.items())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
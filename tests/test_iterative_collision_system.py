@@ -12,65 +12,40 @@ from multi_robot_playground.core.world import GridWorld
 from multi_robot_playground.core.coordinator import MultiAgentCoordinator
 
 
-class TestBasicPathCollisions:
-    """Test basic path-to-path collision detection."""
-
-    def test_same_cell_collision(self):
-        """Two robots trying to enter the same cell."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
-        # Both robots will try to enter (4,3)
-        coordinator.add_robot("robotA", start=(3, 3), goal=(5, 3))
-        coordinator.add_robot("robotB", start=(5, 3), goal=(3, 3))
-
-        coordinator.recompute_paths()
-
-        # Step - should detect same_cell collision
-        _, collision, _, blocked = coordinator.step_simulation()
-
-        assert len(blocked) == 2, "Both robots should be blocked"
-        assert "robotA" in blocked
-        assert "robotB" in blocked
-        print("✓ Same-cell collision: both robots blocked")
-
-    def test_swap_collision(self):
-        """Two robots exchanging positions."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
+# (collision type, robotA start, robotA goal, robotB start, robotB goal)
+PAIR_COLLISIONS = [
+    # Both robots will try to enter (4,3)
+    ("same_cell", (3, 3), (5, 3), (5, 3), (3, 3)),
+    # Robots will swap positions
+    ("swap", (3, 3), (4, 3), (4, 3), (3, 3)),
+    # robotA moves right through (4,3), robotB moves down from (4,3)
+    ("shear", (3, 3), (5, 3), (4, 3), (4, 5)),
+]
 
-        # Robots will swap positions
-        coordinator.add_robot("robotA", start=(3, 3), goal=(4, 3))
-        coordinator.add_robot("robotB", start=(4, 3), goal=(3, 3))
-
-        coordinator.recompute_paths()
 
-        # Step - should detect swap collision
-        _, collision, _, blocked = coordinator.step_simulation()
-
-        assert len(blocked) == 2, "Both robots should be blocked"
-        assert "robotA" in blocked
-        assert "robotB" in blocked
-        print("✓ Swap collision: both robots blocked")
+class TestBasicPathCollisions:
+    """Test basic path-to-path collision detection."""
 
-    def test_shear_collision(self):
-        """Perpendicular crossing collision."""
+    @pytest.mark.parametrize("kind,start_a,goal_a,start_b,goal_b", PAIR_COLLISIONS,
+                             ids=[case[0] for case in PAIR_COLLISIONS])
+    def test_pair_collision(self, kind, start_a, goal_a, start_b, goal_b):
+        """Same-cell, swap and shear collisions block both robots."""
         world = GridWorld(10, 10)
         coordinator = MultiAgentCoordinator(world)
 
-        # robotA moves right through (4,3), robotB moves down from (4,3)
-        coordinator.add_robot("robotA", start=(3, 3), goal=(5, 3))
-        coordinator.add_robot("robotB", start=(4, 3), goal=(4, 5))
+        coordinator.add_robots([
+            ("robotA", start_a, goal_a),
+            ("robotB", start_b, goal_b),
+        ])
 
         coordinator.recompute_paths()
 
-        # Step - should detect shear collision
+        # Step - should detect the collision
         _, collision, _, blocked = coordinator.step_simulation()
 
-        assert len(blocked) == 2, "Both robots should be blocked"
-        assert "robotA" in blocked
-        assert "robotB" in blocked
-        print("✓ Shear collision: both robots blocked")
+        assert collision[2] == kind, f"Expected {kind} collision, got {collision}"
+        assert set(blocked) == {"robotA", "robotB"}, "Both robots should be blocked"
+        print(f"✓ {kind} collision: both robots blocked")
 
 
 class TestBlockedRobotCollisions:
@@ -95,10 +70,8 @@ class TestBlockedRobotCollisions:
         # Iteration 2: C→A blocked robot collision detected
         _, collision, _, blocked = coordinator.step_simulation()
 
-        assert len(blocked) == 3, f"All three robots should be blocked, got {len(blocked)}"
-        assert "robotA" in blocked
-        assert "robotB" in blocked
-        assert "robotC" in blocked
+        assert set(blocked) == {"robotA", "robotB", "robotC"}, \
+            f"All three robots should be blocked, got {sorted(blocked)}"
         print("✓ Blocked robot collision: C blocked by A's position")
 
     def test_cascade_chain(self):
@@ -106,14 +79,15 @@ class TestBlockedRobotCollisions:
         world = GridWorld(10, 10)
         coordinator = MultiAgentCoordinator(world)
 
-        # A and B will collide (swap)
-        coordinator.add_robot("robotA", start=(5, 5), goal=(6, 5))
-        coordinator.add_robot("robotB", start=(6, 5), goal=(5, 5))
-
-        # C tries to go through A, D through C, E through D
-        coordinator.add_robot("robotC", start=(4, 5), goal=(7, 5))  # Through A at (5,5)
-        coordinator.add_robot("robotD", start=(3, 5), goal=(7, 5))  # Through C at (4,5)
-        coordinator.add_robot("robotE", start=(2, 5), goal=(7, 5))  # Through D at (3,5)
+        coordinator.add_robots([
+            # A and B will collide (swap)
+            ("robotA", (5, 5), (6, 5)),
+            ("robotB", (6, 5), (5, 5)),
+            # C tries to go through A, D through C, E through D
+            ("robotC", (4, 5), (7, 5)),  # Through A at (5,5)
+            ("robotD", (3, 5), (7, 5)),  # Through C at (4,5)
+            ("robotE", (2, 5), (7, 5)),  # Through D at (3,5)
+        ])
 
         coordinator.recompute_paths()
 
@@ -124,9 +98,8 @@ class TestBlockedRobotCollisions:
         # Iteration 4: E blocked by D
         _, collision, _, blocked = coordinator.step_simulation()
 
-        assert len(blocked) == 5, f"All five robots should be blocked, got {len(blocked)}"
-        for robot in ["robotA", "robotB", "robotC", "robotD", "robotE"]:
-            assert robot in blocked, f"{robot} should be blocked"
+        assert set(blocked) == {"robotA", "robotB", "robotC", "robotD", "robotE"}, \
+            f"All five robots should be blocked, got {sorted(blocked)}"
         print("✓ Cascade chain: All 5 robots blocked through iterations")
 
 
@@ -151,9 +124,7 @@ class TestMultipleSimultaneousCollisions:
         # Step - should detect both collisions
         _, collision, _, blocked = coordinator.step_simulation()
 
-        assert len(blocked) == 4, "All four robots should be blocked"
-        for robot in ["robotA", "robotB", "robotC", "robotD"]:
-            assert robot in blocked
+        assert set(blocked) == {"robotA", "robotB", "robotC", "robotD"}, "All four robots should be blocked"
         print("✓ Two simultaneous swaps: 4 robots blocked")
 
     def test_multiple_collisions_with_cascade(self):
@@ -178,9 +149,8 @@ class TestMultipleSimultaneousCollisions:
         # Step - should block all six
         _, collision, _, blocked = coordinator.step_simulation()
 
-        assert len(blocked) == 6, f"All six robots should be blocked, got {len(blocked)}"
-        for robot in ["robotA", "robotB", "robotC", "robotD", "robotE", "robotF"]:
-            assert robot in blocked, f"{robot} should be blocked"
+        assert set(blocked) == {"robotA", "robotB", "robotC", "robotD", "robotE", "robotF"}, \
+            f"All six robots should be blocked, got {sorted(blocked)}"
         print("✓ Multiple collisions with cascade: 6 robots blocked")
 
 
@@ -200,7 +170,7 @@ class TestCollisionRecovery:
 
         # Create collision
         _, collision, _, blocked = coordinator.step_simulation()
-        assert len(blocked) == 2
+        assert set(blocked) == {"robotA", "robotB"}
 
         # Place obstacle to force alternate paths
         coordinator.add_dynamic_obstacle(4, 3)
@@ -212,40 +182,22 @@ class TestCollisionRecovery:
         assert len(blocked) < 2, "Some or all robots should be unblocked with new paths"
         print(f"✓ Obstacle placement: {2 - len(blocked)} robots recovered")
 
+    def test_blocked_as_obstacles_is_temporary(self, world, coordinator):
+        """Treating blocked robots as obstacles must not change the world."""
+        coordinator.add_robot("robotA", start=(3, 3), goal=(5, 3))
+        coordinator.add_robot("robotB", start=(5, 3), goal=(3, 3))
+        world.add_obstacle(7, 7)
+
+        _, _, _, blocked = coordinator.step_simulation()
+        assert set(blocked) == {"robotA", "robotB"}
+
+        coordinator.recompute_paths(treat_paused_as_obstacles=True)
+
+        # Only the real obstacle remains, in both the set and the grid
+        assert world.static_obstacles == {(7, 7)}
+        assert int(world.grid.sum()) == 1
+        print("✓ Blocked robot cells removed after replanning")
+
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("TESTING ITERATIVE COLLISION SYSTEM")
-    print("=" * 60)
-
-    # Basic path collisions
-    print("\n1. Basic Path Collisions")
-    print("-" * 30)
-    basic = TestBasicPathCollisions()
-    basic.test_same_cell_collision()
-    basic.test_swap_collision()
-    basic.test_shear_collision()
-
-    # Blocked robot collisions
-    print("\n2. Blocked Robot Collisions")
-    print("-" * 30)
-    blocked = TestBlockedRobotCollisions()
-    blocked.test_single_blocked_robot_collision()
-    blocked.test_cascade_chain()
-
-    # Multiple simultaneous
-    print("\n3. Multiple Simultaneous Collisions")
-    print("-" * 30)
-    multi = TestMultipleSimultaneousCollisions()
-    multi.test_two_collision_pairs()
-    multi.test_multiple_collisions_with_cascade()
-
-    # Recovery
-    print("\n4. Collision Recovery")
-    print("-" * 30)
-    recovery = TestCollisionRecovery()
-    recovery.test_recovery_via_obstacle()
-
-    print("\n" + "=" * 60)
-    print("ALL ITERATIVE COLLISION TESTS COMPLETE ✓")
-    print("=" * 60)
\ No newline at end of file
+    pytest.main([__file__, "-v"])
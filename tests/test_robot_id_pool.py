@@ -161,6 +161,9 @@ class TestRobotIDPool:
         # Pool should be unchanged
         assert len(game.robot_id_pool) == initial_pool_size
 
+        # The ID was never consumed, so the next robot still gets it
+        assert game.add_robot((1, 1), (5, 5)) == "robot0"
+
 
 if __name__ == "__main__":
     test = TestRobotIDPool()
@@ -7,6 +7,7 @@ Tests adding, removing, and managing multiple robots.
 import pytest
 from multi_robot_playground.core.world import GridWorld
 from multi_robot_playground.core.coordinator import MultiAgentCoordinator
+from multi_robot_playground.core.path_planners.dstar_lite_planner import DStarLitePlanner
 
 
 class TestRobotAddition:
@@ -75,6 +76,21 @@ class TestRobotAddition:
         assert len(coordinator.planners) == 10
         assert len(coordinator.current_positions) == 10
 
+    def test_add_robots_batch(self, world, coordinator):
+        """Batch add should apply add_robot rules to each spec"""
+        world.add_obstacle(5, 5)
+
+        added = coordinator.add_robots([
+            ("robot1", (0, 0), (9, 9)),
+            ("robot2", (0, 0), (9, 0)),  # Start occupied by robot1
+            ("robot3", (5, 5), (0, 9)),  # Start on obstacle
+            ("robot4", (9, 0), (0, 9)),
+        ])
+
+        assert added == ["robot1", "robot4"]
+        assert set(coordinator.planners) == {"robot1", "robot4"}
+        assert coordinator.paths["robot4"][-1] == (0, 9)
+
 
 class TestRobotRemoval:
     """Tests for removing robots from the system"""
@@ -139,8 +155,7 @@ class TestRobotRemoval:
         coordinator = MultiAgentCoordinator(world)
 
         # Add multiple robots
-        for i in range(1, 6):
-            coordinator.add_robot(f"robot{i}", start=(i, i), goal=(9-i, 9-i))
+        coordinator.add_robots([(f"robot{i}", (i, i), (9-i, 9-i)) for i in range(1, 6)])
 
         assert len(coordinator.planners) == 5
 
@@ -201,6 +216,233 @@ class TestRobotManagementIntegration:
         # Path might change but should still exist
         assert len(coordinator.paths["robot2"]) > 0
 
+    def test_obstacle_replans_only_affected_robots(self, coordinator):
+        """Placing an obstacle should only replan robots whose path crosses it"""
+        # Two robots on separate straight rows
+        coordinator.add_robot("robot1", start=(0, 0), goal=(9, 0))
+        coordinator.add_robot("robot2", start=(0, 9), goal=(9, 9))
+        path1 = coordinator.paths["robot1"]
+        path2 = coordinator.paths["robot2"]
+
+        # Block robot1's row only
+        assert coordinator.add_dynamic_obstacle(5, 0)
+
+        # robot1 replanned around the obstacle, robot2's path untouched
+        assert (5, 0) not in coordinator.paths["robot1"]
+        assert len(coordinator.paths["robot1"]) == len(path1) + 2
+        assert coordinator.paths["robot2"] is path2
+
+        # Skipped planner still stays in sync on later steps
+        coordinator.step_simulation()
+        assert coordinator.paths["robot2"][0] == (1, 9)
+        assert coordinator.paths["robot2"][-1] == (9, 9)
+
+    def test_obstacle_replans_robots_with_partial_paths(self):
+        """A path that stops short of the goal is not kept on an obstacle"""
+        world = GridWorld(5, 5)
+        coordinator = MultiAgentCoordinator(world)
+        coordinator.add_robot("robot1", start=(0, 0), goal=(0, 4))
+        coordinator.paths["robot1"] = coordinator.paths["robot1"][:2]
+
+        # The obstacle is off the path, but the path doesn't reach the goal
+        assert coordinator.add_dynamic_obstacle(4, 4)
+        assert coordinator.paths["robot1"] == [(0, y) for y in range(5)]
+
+    def test_recompute_picks_up_direct_world_edits(self):
+        """A bare recompute_paths() should see obstacles edited on the world"""
+        world = GridWorld(5, 5)
+        coordinator = MultiAgentCoordinator(world)
+        world.add_obstacles([(2, y) for y in range(4)])
+        coordinator.add_robot("robot1", start=(0, 0), goal=(4, 0))
+        assert len(coordinator.paths["robot1"]) == 13  # Around the wall
+
+        # Open a shortcut through the wall, then block it again
+        world.remove_obstacle(2, 0)
+        coordinator.recompute_paths()
+        assert coordinator.paths["robot1"] == [(x, 0) for x in range(5)]
+
+        world.add_obstacle(3, 0)
+        coordinator.recompute_paths()
+        assert len(coordinator.paths["robot1"]) == 13
+        assert (3, 0) not in coordinator.paths["robot1"]
+
+    def test_robots_reach_goals_after_random_edits(self):
+        """Mixed obstacle edits and replans never strand a robot with a reachable goal"""
+        import random
+
+        def reachable(world, start, goal):
+            seen, frontier = {start}, [start]
+            while frontier:
+                x, y = frontier.pop()
+                for nx, ny, _ in world.get_neighbors(x, y):
+                    if (nx, ny) not in seen and world.is_free(nx, ny):
+                        seen.add((nx, ny))
+                        frontier.append((nx, ny))
+            return goal in seen
+
+        for seed in range(60):
+            rng = random.Random(seed)
+            world = GridWorld(8, 8)
+            coordinator = MultiAgentCoordinator(world)
+            cells = [(x, y) for x in range(8) for y in range(8)]
+            rng.shuffle(cells)
+            world.add_obstacles(cells[:10])
+            coordinator.add_robots([(f"robot{i}", cells[10 + i], cells[20 + i])
+                                    for i in range(4)])
+
+            for _ in range(30):
+                action, cell = rng.random(), (rng.randrange(8), rng.randrange(8))
+                if action < 0.15:
+                    coordinator.add_dynamic_obstacle(*cell)
+                elif action < 0.25:
+                    coordinator.remove_dynamic_obstacle(*cell)
+                elif action < 0.3:
+                    # Edit the world directly, bypassing the coordinator
+                    if cell not in coordinator.current_positions.values():
+                        world.add_obstacle(*cell)
+                        coordinator.recompute_paths()
+                elif action < 0.4:
+                    coordinator.set_new_goal(rng.choice(list(coordinator.planners)), cell)
+                elif action < 0.5:
+                    coordinator.recompute_paths(treat_paused_as_obstacles=True)
+                coordinator.step_simulation()
+            coordinator.run_until(lambda result: False, max_steps=30)
+
+            for robot_id, pos in coordinator.current_positions.items():
+                goal = coordinator.goals[robot_id]
+                if pos != goal and reachable(world, pos, goal):
+                    path = coordinator.paths[robot_id]
+                    assert path and path[-1] == goal, (seed, robot_id)
+
+    def test_recompute_on_unchanged_world_does_no_planning(self, world, coordinator, monkeypatch):
+        """Repeated recompute_paths() calls without world changes are no-ops"""
+        coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
+        world.add_obstacle(5, 5)
+        coordinator.recompute_paths()
+        paths = dict(coordinator.paths)
+
+        def fail_search(*args):
+            raise AssertionError("planner was rerun")
+
+        monkeypatch.setattr(DStarLitePlanner, "compute_shortest_path", fail_search)
+        coordinator.recompute_paths()
+        coordinator.recompute_paths()
+        assert coordinator.paths == paths
+        monkeypatch.undo()
+
+        # A goal change still replans on the unchanged world
+        assert coordinator.set_new_goal("robot1", (0, 9))
+        assert coordinator.paths["robot1"][-1] == (0, 9)
+
+    def test_step_keeps_paths_of_robots_that_did_not_move(self, coordinator):
+        """A step should only replan robots that moved"""
+        coordinator.add_robots([
+            ("robot1", (3, 3), (4, 3)),  # robot1 and robot2 swap -> blocked
+            ("robot2", (4, 3), (3, 3)),
+            ("robot3", (0, 9), (9, 9)),
+        ])
+        path1 = coordinator.paths["robot1"]
+        path2 = coordinator.paths["robot2"]
+
+        _, _, _, blocked = coordinator.step_simulation()
+
+        assert set(blocked) == {"robot1", "robot2"}
+        assert coordinator.paths["robot1"] is path1
+        assert coordinator.paths["robot2"] is path2
+        assert coordinator.paths["robot3"][0] == (1, 9)
+
+    def test_step_replans_blocked_robots_after_direct_world_edits(self, world, coordinator):
+        """A robot that stays put still picks up obstacles edited on the world"""
+        coordinator.add_robots([
+            ("robot1", (0, 5), (9, 5)),  # Both enter (1, 5) -> blocked
+            ("robot2", (1, 4), (1, 9)),
+            ("robot3", (9, 0), (9, 3)),  # Keeps the simulation moving
+        ])
+        _, _, _, blocked = coordinator.step_simulation()
+        assert set(blocked) == {"robot1", "robot2"}
+
+        world.add_obstacle(5, 5)
+        _, _, _, blocked = coordinator.step_simulation()
+        assert "robot1" in blocked
+        assert (5, 5) not in coordinator.paths["robot1"]
+
+    def test_step_advances_path_without_search_on_unchanged_map(self, world, coordinator, monkeypatch):
+        """Moving along a path on an unchanged map should not rerun the planner"""
+        coordinator.add_robot("robot1", start=(0, 0), goal=(0, 9))
+        path = coordinator.paths["robot1"]
+
+        def fail_search(*args):
+            raise AssertionError("planner was rerun")
+
+        monkeypatch.setattr(DStarLitePlanner, "compute_shortest_path", fail_search)
+        coordinator.step_simulation(steps=2)
+        assert coordinator.paths["robot1"] == path[2:]
+        monkeypatch.undo()
+
+        # A direct world edit makes the next step replan around it
+        world.add_obstacle(0, 5)
+        coordinator.step_simulation()
+        assert coordinator.current_positions["robot1"] == (0, 3)
+        assert (0, 5) not in coordinator.paths["robot1"]
+        assert coordinator.paths["robot1"][-1] == (0, 9)
+
+    def test_parallel_planning_matches_serial(self):
+        """Thread-pool replanning should give the same paths as serial"""
+        specs = [(f"robot{i}", (i, 0), (9 - i, 9)) for i in range(6)]
+        obstacles = [(x, 5) for x in range(1, 10)]
+
+        results = []
+        for parallel in (False, True):
+            world = GridWorld(10, 10)
+            coordinator = MultiAgentCoordinator(world, parallel_planning=parallel)
+            coordinator.add_robots(specs)
+            world.add_obstacles(obstacles)
+            coordinator.recompute_paths(changed_cells=set(obstacles))
+            coordinator.step_simulation(steps=3)
+            results.append((dict(coordinator.paths), dict(coordinator.current_positions)))
+
+        assert results[0] == results[1]
+
+    def test_step_simulation_multiple_steps(self):
+        """Batched steps should match single steps and stop at the goal"""
+        world = GridWorld(10, 10)
+        coordinator = MultiAgentCoordinator(world)
+        coordinator.add_robot("robot1", start=(0, 0), goal=(3, 0))
+
+        should_continue, _, _, _ = coordinator.step_simulation(steps=2)
+        assert should_continue
+        assert coordinator.current_positions["robot1"] == (2, 0)
+
+        # More steps than needed: stops once the robot is at its goal
+        should_continue, _, _, _ = coordinator.step_simulation(steps=10)
+        assert not should_continue
+        assert coordinator.current_positions["robot1"] == (3, 0)
+
+    def test_run_until_stops_when_predicate_holds(self, coordinator):
+        """run_until should stop on the first step satisfying the predicate"""
+        coordinator.add_robot("robot1", start=(0, 0), goal=(9, 0))
+
+        coordinator.run_until(
+            lambda result: coordinator.current_positions["robot1"] == (4, 0))
+        assert coordinator.current_positions["robot1"] == (4, 0)
+
+        # max_steps caps the run even if the predicate never holds
+        should_continue, _, _, _ = coordinator.run_until(lambda result: False, max_steps=2)
+        assert should_continue
+        assert coordinator.current_positions["robot1"] == (6, 0)
+
+        # Stops at the goal
+        should_continue, _, _, _ = coordinator.run_until(lambda result: False)
+        assert not should_continue
+        assert coordinator.current_positions["robot1"] == (9, 0)
+
+        # Stops on the first collision
+        coordinator.add_robot("robot2", start=(3, 3), goal=(4, 3))
+        coordinator.add_robot("robot3", start=(4, 3), goal=(3, 3))
+        _, collision, _, blocked = coordinator.run_until(lambda result: result[3])
+        assert collision is not None
+        assert set(blocked) == {"robot2", "robot3"}
+
     def test_robot_limit(self):
         """Should handle reasonable robot limits"""
         world = GridWorld(10, 10)
@@ -3,26 +3,19 @@ Test stuck robot detection in the coordinator.
 Stuck robots should be detected both during simulation and when checking state.
 """
 import pytest
-from multi_robot_playground.core.world import GridWorld
-from multi_robot_playground.core.coordinator import MultiAgentCoordinator
+from multi_robot_playground.core.path_planners.dstar_lite_planner import DStarLitePlanner
 
 
 class TestStuckRobotDetection:
     """Test that stuck robots are properly detected at the coordinator level."""
 
-    def test_detect_stuck_robots_method_exists(self):
+    def test_detect_stuck_robots_method_exists(self, coordinator):
         """Coordinator should have a method to detect stuck robots."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Method should exist
         assert hasattr(coordinator, 'detect_stuck_robots'), "Coordinator should have detect_stuck_robots method"
 
-    def test_stuck_robot_basic(self):
+    def test_stuck_robot_basic(self, world, coordinator):
         """A robot with no path should be detected as stuck."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add robot with goal blocked by obstacles
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
 
@@ -46,11 +39,8 @@ class TestStuckRobotDetection:
 
         assert "robot1" in stuck, "Robot with no path should be detected as stuck"
 
-    def test_robot_at_goal_not_stuck(self):
+    def test_robot_at_goal_not_stuck(self, coordinator):
         """A robot at its goal should not be considered stuck."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add robot at its goal
         coordinator.add_robot("robot1", start=(5, 5), goal=(5, 5))
 
@@ -59,11 +49,8 @@ class TestStuckRobotDetection:
 
         assert "robot1" not in stuck, "Robot at goal should not be stuck"
 
-    def test_multiple_stuck_robots(self):
+    def test_multiple_stuck_robots(self, world, coordinator):
         """Multiple stuck robots should all be detected."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         # Add two robots
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
         coordinator.add_robot("robot2", start=(0, 1), goal=(9, 8))
@@ -81,11 +68,8 @@ class TestStuckRobotDetection:
         assert "robot1" in stuck
         assert "robot2" in stuck
 
-    def test_stuck_robot_recovery(self):
+    def test_stuck_robot_recovery(self, world, coordinator):
         """Stuck robot should recover when path becomes available."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
 
         # Block the path
@@ -103,11 +87,8 @@ class TestStuckRobotDetection:
         stuck = coordinator.detect_stuck_robots()
         assert "robot1" not in stuck, "Robot should recover when path available"
 
-    def test_stuck_stored_as_instance_variable(self):
+    def test_stuck_stored_as_instance_variable(self, world, coordinator):
         """Stuck robots should be stored in coordinator.stuck_robots."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
 
         # Block the path
@@ -121,11 +102,8 @@ class TestStuckRobotDetection:
         assert hasattr(coordinator, 'stuck_robots'), "Should have stuck_robots attribute"
         assert "robot1" in coordinator.stuck_robots
 
-    def test_stuck_detection_during_step(self):
+    def test_stuck_detection_during_step(self, world, coordinator):
         """Stuck robots should be detected during step_simulation."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
 
         # Block the path
@@ -139,11 +117,64 @@ class TestStuckRobotDetection:
 
         assert "robot1" in stuck_robots, "Step should detect stuck robots"
 
-    def test_stuck_vs_paused_distinction(self):
-        """Stuck and paused robots should be tracked separately."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
+    def test_stuck_robot_not_replanned_until_map_changes(self, world, coordinator, monkeypatch):
+        """Steps should not replan a stuck robot until obstacles change."""
+        coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
+        for x in range(10):
+            world.add_obstacle(x, 5)
+        coordinator.recompute_paths()
+
+        def fail_search(*args):
+            raise AssertionError("stuck robot was replanned")
 
+        monkeypatch.setattr(DStarLitePlanner, "compute_shortest_path", fail_search)
+        for _ in range(3):
+            _, _, stuck_robots, _ = coordinator.step_simulation()
+            assert "robot1" in stuck_robots
+        monkeypatch.undo()
+
+        # Opening the wall is picked up on the next step
+        world.remove_obstacle(0, 5)
+        coordinator.step_simulation()
+        assert "robot1" not in coordinator.stuck_robots
+        assert coordinator.paths["robot1"][-1] == (9, 9)
+
+    def test_stuck_robot_with_one_cell_path_is_replanned(self, coordinator):
+        """A stuck robot whose path is just its own cell is replanned on steps."""
+        coordinator.add_robot("robot1", start=(1, 5), goal=(4, 0))
+        coordinator.add_robot("robot2", start=(3, 4), goal=(1, 4))
+
+        # robot1 stops on robot2's goal; planning around it as an obstacle
+        # leaves robot2 with a path that goes nowhere
+        for _ in range(2):
+            coordinator.step_simulation()
+            coordinator.recompute_paths(treat_paused_as_obstacles=True)
+        assert coordinator.paths["robot2"] == [(2, 4)]
+        assert "robot2" in coordinator.detect_stuck_robots()
+
+        # Once robot1 moves on, robot2 gets a real path again
+        coordinator.run_until(lambda result: False, max_steps=30)
+        assert coordinator.current_positions["robot1"] == (4, 0)
+        assert coordinator.current_positions["robot2"] == (1, 4)
+
+    def test_one_cell_path_robot_reaches_goal_once_map_is_clear(self, coordinator):
+        """A robot left in place by a paused-obstacle replan moves once the map clears."""
+        coordinator.add_robot("robot1", start=(1, 5), goal=(4, 0))
+        coordinator.add_robot("robot2", start=(3, 4), goal=(1, 4))
+        for _ in range(2):
+            coordinator.step_simulation()
+            coordinator.recompute_paths(treat_paused_as_obstacles=True)
+        assert coordinator.paths["robot2"] == [(2, 4)]
+
+        # Clear the map: the robot standing on robot2's goal goes away
+        coordinator.remove_robot("robot1")
+
+        coordinator.run_until(lambda result: False, max_steps=5)
+        assert coordinator.current_positions["robot2"] == (1, 4)
+        assert not coordinator.stuck_robots
+
+    def test_stuck_vs_paused_distinction(self, world, coordinator):
+        """Stuck and paused robots should be tracked separately."""
         # Two robots that will collide
         coordinator.add_robot("robot1", start=(0, 0), goal=(2, 0))
         coordinator.add_robot("robot2", start=(2, 0), goal=(0, 0))
@@ -168,11 +199,8 @@ class TestStuckRobotDetection:
             for paused in paused_robots:
                 assert paused not in stuck_robots, f"{paused} should not be both paused and stuck"
 
-    def test_empty_path_means_stuck(self):
+    def test_empty_path_means_stuck(self, world, coordinator):
         """A robot with empty path (not at goal) should be stuck."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
 
         # Surround robot completely
@@ -192,11 +220,8 @@ class TestStuckRobotDetection:
         stuck = coordinator.detect_stuck_robots()
         assert "robot1" in stuck, "Robot with no valid path should be stuck"
 
-    def test_stuck_persists_across_calls(self):
+    def test_stuck_persists_across_calls(self, world, coordinator):
         """Stuck status should persist across multiple detect calls."""
-        world = GridWorld(10, 10)
-        coordinator = MultiAgentCoordinator(world)
-
         coordinator.add_robot("robot1", start=(0, 0), goal=(9, 9))
 
         # Block the path
@@ -241,6 +241,92 @@ def test_complex_scenario():
 
     print(Fore.GREEN + "✓ Complex scenario handles obstacles and robots correctly")
 
+def test_path_validation():
+    """Test 7: Whole-path obstacle check"""
+    print(Fore.GREEN + "\n[TEST 7] Path Validation")
+
+    world = GridWorld(10, 10)
+    world.add_obstacle(3, 3)
+    # Direct set mutation must be honored too
+    world.static_obstacles.add((5, 5))
+
+    assert world.is_path_free([(0, 0), (1, 0), (2, 0)])
+    assert world.is_path_free([])
+    assert not world.is_path_free([(2, 3), (3, 3), (4, 3)])
+    assert not world.is_path_free([(5, 4), (5, 5)])
+    assert not world.is_path_free([(9, 9), (10, 9)])  # Out of bounds
+
+    # Must agree with per-cell is_free()
+    path = [(x, 3) for x in range(10)]
+    assert world.is_path_free(path) == all(world.is_free(x, y) for x, y in path)
+
+    print(Fore.GREEN + "✓ is_path_free() matches per-cell is_free()")
+
+def test_batch_obstacles():
+    """Test 8: Batch obstacle placement"""
+    print(Fore.GREEN + "\n[TEST 8] Batch Obstacles")
+
+    world = GridWorld(10, 10)
+    world.add_obstacle(1, 1)
+
+    added = world.add_obstacles([(1, 1), (2, 3), (4, 5), (10, 10), (-1, 0)])
+
+    # Only new, in-bounds cells are reported
+    assert added == {(2, 3), (4, 5)}
+    assert world.static_obstacles == {(1, 1), (2, 3), (4, 5)}
+
+    # Grid stays in sync with the obstacle set
+    for x, y in world.static_obstacles:
+        assert world.grid[y, x] == CellType.OBSTACLE.value
+    assert int((world.grid == CellType.OBSTACLE.value).sum()) == 3
+
+    assert world.add_obstacles([]) == set()
+
+    print(Fore.GREEN + "✓ add_obstacles() places obstacles in one batch")
+
+def test_neighbor_cache_resize():
+    """Test 9: Cached neighbors follow world resizes"""
+    print(Fore.GREEN + "\n[TEST 9] Neighbor Cache After Resize")
+
+    world = GridWorld(10, 10)
+
+    # Repeated lookups reuse the same cached tuple
+    edge_neighbors = world.get_neighbors(9, 5)
+    assert world.get_neighbors(9, 5) is edge_neighbors
+    assert len(edge_neighbors) == 3
+
+    # Growing the world turns the old edge cell into an interior cell
+    world.resize(12, 12)
+    assert len(world.get_neighbors(9, 5)) == 4
+
+    # Shrinking drops neighbors that fell off the grid
+    world.resize(5, 5)
+    assert {(nx, ny) for nx, ny, _ in world.get_neighbors(4, 4)} == {(3, 4), (4, 3)}
+
+    # Worlds of the same size share cached neighbor tuples
+    assert GridWorld(10, 10).get_neighbors(9, 5) is edge_neighbors
+
+    print(Fore.GREEN + "✓ Neighbor cache is rebuilt after resize")
+
+def test_neighbor_cache_bounded():
+    """Test 10: Shared neighbor caches are kept for a few sizes only"""
+    print(Fore.GREEN + "\n[TEST 10] Neighbor Cache Bound")
+    from multi_robot_playground.core import world as world_module
+
+    # Many differently sized worlds don't grow the cache without limit
+    for size in range(40, 60):
+        GridWorld(size, size).get_neighbors(0, 0)
+    assert len(world_module._NEIGHBOR_CACHES) == world_module._MAX_NEIGHBOR_CACHES
+
+    # A world whose cache was evicted keeps using its own
+    world = GridWorld(100, 100)
+    neighbors = world.get_neighbors(50, 50)
+    for size in range(40, 60):
+        GridWorld(size, size)
+    assert world.get_neighbors(50, 50) is neighbors
+
+    print(Fore.GREEN + "✓ Neighbor caches are bounded")
+
 if __name__ == "__main__":
     print(Fore.CYAN + Style.BRIGHT + "\n" + "="*50)
     print(Fore.CYAN + Style.BRIGHT + "GRIDWORLD TEST SUITE")
@@ -253,6 +339,10 @@ if __name__ == "__main__":
         test_robot_positions()
         test_boundary_validation()
         test_complex_scenario()
+        test_path_validation()
+        test_batch_obstacles()
+        test_neighbor_cache_resize()
+        test_neighbor_cache_bounded()
 
         print(Fore.GREEN + Style.BRIGHT + "\n" + "="*50)
         print(Fore.GREEN + Style.BRIGHT + "ALL TESTS PASSED!")
@@ -6,7 +6,7 @@ Tests dynamic arena size changes while preserving content.
 
 import pytest
 import numpy as np
-from multi_robot_playground.core.world import GridWorld
+from multi_robot_playground.core.world import GridWorld, CellType
 from multi_robot_playground.core.coordinator import MultiAgentCoordinator
 
 
@@ -235,6 +235,34 @@ class TestCoordinatorResize:
             assert len(coordinator.goals) == 0
             assert len(world.static_obstacles) == 0
 
+    def test_coordinator_reset_keeps_size(self):
+        """Reset should clear everything in place without changing dimensions"""
+        world = GridWorld(7, 7)
+        coordinator = MultiAgentCoordinator(world)
+        grid = world.grid
+
+        # Add robots, obstacles and a collision
+        coordinator.add_robot("robot1", start=(2, 2), goal=(3, 2))
+        coordinator.add_robot("robot2", start=(3, 2), goal=(2, 2))
+        world.add_obstacle(5, 5)
+        coordinator.step_simulation()
+        assert coordinator.collision_blocked_robots
+
+        coordinator.reset()
+
+        # Same world object and grid buffer, same size, clean slate
+        assert coordinator.world is world
+        assert world.grid is grid
+        assert world.width == 7
+        assert world.height == 7
+        assert len(world.static_obstacles) == 0
+        assert (world.grid == CellType.EMPTY.value).all()
+        assert len(world.robot_positions) == 0
+        assert len(coordinator.planners) == 0
+        assert len(coordinator.paths) == 0
+        assert len(coordinator.collision_blocked_robots) == 0
+        assert coordinator.collision_details == []
+
 
 class TestEdgeCases:
     """Edge case tests for resizing"""
@@ -101,6 +101,23 @@ def test_remove_obstacle():
     assert (5, 5) not in game.world.static_obstacles
 
 
+def test_clear_obstacles_replans_paths():
+    """Clearing obstacles lets robots take the freed shortest route."""
+    from multi_robot_playground.web.game_manager import GameManager
+
+    game = GameManager()
+    game.add_robot((0, 0), (9, 0))
+    for y in range(9):
+        game.add_obstacle(5, y)
+    assert len(game.coordinator.paths["robot0"]) > 10
+
+    game.clear_obstacles()
+
+    assert not game.world.static_obstacles
+    assert not game.world.grid.any()
+    assert len(game.coordinator.paths["robot0"]) == 10
+
+
 def test_set_robot_goal():
     """Setting new goal updates robot and triggers replan."""
     from multi_robot_playground.web.game_manager import GameManager